@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Shared HTTP plumbing for *arr validator scripts.
+
+One pooled keep-alive session serves every caller in the process, so
+validators chained in a cron job or hook pay a single TCP handshake per
+host instead of one per call, and transient 5xx responses are retried at
+the transport layer.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# orjson's SIMD parser beats stdlib json several-fold on the larger *arr
+# responses (movie lists, history) and takes the raw response bytes
+# directly; stdlib json accepts bytes too, so the fallback is drop-in.
+try:  # pragma: no cover - optional speedup
+  import orjson as _json
+except ImportError:
+  import json as _json
+
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+  pool_connections=4,
+  pool_maxsize=8,
+  max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[500, 502, 503]),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+def get_json(url: str, api_key: str, timeout: float = 5.0) -> Any:
+  """GET ``url`` with the given API key and return the decoded JSON body."""
+  response = SESSION.get(url, headers={"X-Api-Key": api_key}, timeout=timeout)
+  response.raise_for_status()
+  return _json.loads(response.content)
+
+
+ETAG_CACHE_DIR = Path.home() / ".cache" / "arr-validate"
+
+
+def _etag_cache_path(url: str) -> Path:
+  return ETAG_CACHE_DIR / (hashlib.blake2b(url.encode(), digest_size=8).hexdigest() + ".json")
+
+
+def get_json_conditional(url: str, api_key: str, timeout: float = 5.0) -> Any:
+  """Conditional variant of :func:`get_json` for slow-changing endpoints.
+
+  Remembers each URL's ETag and body on disk and sends If-None-Match on
+  the next run; a 304 answer replays the cached body, so steady-state
+  validations transfer headers only. Falls back to a plain GET whenever
+  the server omits ETags or the cache is unreadable.
+  """
+  cache_path = _etag_cache_path(url)
+  etag = body = None
+  try:
+    with open(cache_path, encoding="utf-8") as file:
+      cached = json.load(file)
+    etag, body = cached["etag"], cached["body"]
+  except (OSError, ValueError, KeyError):
+    pass
+
+  headers = {"X-Api-Key": api_key}
+  if etag:
+    headers["If-None-Match"] = etag
+  response = SESSION.get(url, headers=headers, timeout=timeout)
+  if response.status_code == 304 and body is not None:
+    return _json.loads(body)
+  response.raise_for_status()
+
+  if (new_etag := response.headers.get("ETag")) is not None:
+    try:  # best-effort atomic write; never fails the request
+      ETAG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+      fd, tmp = tempfile.mkstemp(dir=ETAG_CACHE_DIR, suffix=".tmp")
+      with os.fdopen(fd, "w", encoding="utf-8") as file:
+        json.dump({"etag": new_etag, "body": response.text}, file)
+      os.replace(tmp, cache_path)
+    except OSError:
+      pass
+  return _json.loads(response.content)
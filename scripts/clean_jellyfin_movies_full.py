@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """Clean ALL movie-related data from Jellyfin database including related tables."""
+import shutil
 import sqlite3
 import sys
 import os
-from pathlib import Path
 
 JELLYFIN_DB = os.getenv("CONFIG_DIRECTORY", "/mnt/docker-usb") + "/jellyfin/data/data/jellyfin.db"
 
@@ -13,32 +13,50 @@ def main() -> int:
         print(f"ERROR: Database not found: {JELLYFIN_DB}", file=sys.stderr)
         return 1
     
-    # Backup
+    # Backup (streamed copy — avoids loading the whole DB into RAM)
     backup = f"{JELLYFIN_DB}.backup-full-clean"
-    Path(backup).write_bytes(Path(JELLYFIN_DB).read_bytes())
+    shutil.copyfile(JELLYFIN_DB, backup)
     print(f"✓ Created backup: {backup}")
     
     conn = sqlite3.connect(JELLYFIN_DB)
     cursor = conn.cursor()
     
     try:
-        # Get movie IDs
-        cursor.execute("SELECT Id FROM BaseItems WHERE Type = 'MediaBrowser.Controller.Entities.Movies.Movie'")
-        movie_ids = [row[0] for row in cursor.fetchall()]
-        
-        cursor.execute("SELECT Id FROM BaseItems WHERE Type = 'MediaBrowser.Controller.Entities.Movies.BoxSet'")
-        boxset_ids = [row[0] for row in cursor.fetchall()]
-        
-        all_ids = movie_ids + boxset_ids
-        print(f"Found {len(movie_ids)} movies and {len(boxset_ids)} boxsets")
-        
-        if not all_ids:
+        # Count only (for display) — the ids themselves never leave SQLite
+        cursor.execute("SELECT COUNT(*) FROM BaseItems WHERE Type = 'MediaBrowser.Controller.Entities.Movies.Movie'")
+        movie_count = cursor.fetchone()[0]
+
+        cursor.execute("SELECT COUNT(*) FROM BaseItems WHERE Type = 'MediaBrowser.Controller.Entities.Movies.BoxSet'")
+        boxset_count = cursor.fetchone()[0]
+
+        total_count = movie_count + boxset_count
+        print(f"Found {movie_count} movies and {boxset_count} boxsets")
+
+        if not total_count:
             print("No movies to clean")
             return 0
-        
-        # Delete from related tables
-        placeholders = ','.join(['?' for _ in all_ids])
-        
+
+        # Durability pragmas relaxed for the bulk delete — we just took a file backup.
+        cursor.executescript(
+            "PRAGMA synchronous=OFF;"
+            "PRAGMA journal_mode=MEMORY;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-262144;"
+        )
+
+        # Stage ids in a temp table so each DELETE is one compiled statement
+        # with an index-driven subquery, instead of a giant IN (?,?,...) list
+        # that hits SQLite's parameter limit on large libraries. The INSERT
+        # SELECT keeps the whole id set inside SQLite — no Python round-trip.
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("CREATE TEMP TABLE _del_ids (Id BLOB PRIMARY KEY)")
+        cursor.execute("""
+            INSERT INTO _del_ids
+            SELECT Id FROM BaseItems
+            WHERE Type IN ('MediaBrowser.Controller.Entities.Movies.Movie',
+                           'MediaBrowser.Controller.Entities.Movies.BoxSet')
+        """)
+
         tables_to_clean = [
             'BaseItemProviders',
             'BaseItemImageInfos',
@@ -55,18 +73,24 @@ def main() -> int:
             'KeyframeData'
         ]
         
+        # One catalog probe instead of a try/except per table. (executescript
+        # would be a single call but implicitly COMMITs the open transaction,
+        # so the DELETEs stay on cursor.execute inside the one transaction.)
+        existing_tables = {
+            row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+
         for table in tables_to_clean:
-            try:
-                cursor.execute(f"DELETE FROM {table} WHERE ItemId IN ({placeholders})", all_ids)
-                deleted = cursor.rowcount
-                if deleted > 0:
-                    print(f"  Cleaned {deleted} rows from {table}")
-            except Exception as e:
-                print(f"  Note: {table} - {e}")
-        
+            if table not in existing_tables:
+                continue
+            cursor.execute(f"DELETE FROM {table} WHERE ItemId IN (SELECT Id FROM _del_ids)")
+            deleted = cursor.rowcount
+            if deleted > 0:
+                print(f"  Cleaned {deleted} rows from {table}")
+
         # Delete the movies themselves
-        cursor.execute(f"DELETE FROM BaseItems WHERE Id IN ({placeholders})", all_ids)
-        print(f"✓ Deleted {len(all_ids)} items from BaseItems")
+        cursor.execute("DELETE FROM BaseItems WHERE Id IN (SELECT Id FROM _del_ids)")
+        print(f"✓ Deleted {cursor.rowcount} items from BaseItems")
         
         conn.commit()
         print(f"✓ Database fully cleaned")
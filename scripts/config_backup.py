@@ -34,12 +34,20 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import contextlib
 import fnmatch
 import hashlib
+import mmap
 import os
+import re
+import shutil
+import subprocess
 import sys
 import tarfile
+import threading
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -65,16 +73,39 @@ DEFAULT_SERVICES = [
 ]
 
 
-def sha256_file(path: Path) -> str:
-  h = hashlib.sha256()
-  with path.open("rb") as f:
-    for chunk in iter(lambda: f.read(1024 * 1024), b""):
-      h.update(chunk)
-  return h.hexdigest()
+# Below this size the mmap setup cost outweighs saving the read copies.
+_MMAP_HASH_THRESHOLD = 64 * 1024 * 1024
 
 
-def list_archives(backup_dir: Path) -> list[Path]:
-  return sorted(backup_dir.glob("configs-*.tar.gz"))
+def sha256_file(path: Path) -> str:
+  # Large files: mmap the whole archive and hand the mapping straight to the
+  # hash, so pages flow kernel→SHA with no intermediate bytes objects.
+  # Smaller files: file_digest reads into a reusable buffer in the C layer.
+  # Both paths pick up SHA-NI acceleration where the CPU has it.
+  with path.open("rb", buffering=0) as f:
+    if path.stat().st_size > _MMAP_HASH_THRESHOLD:
+      try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+          h = hashlib.sha256()
+          h.update(mm)
+          return h.hexdigest()
+      except (ValueError, OSError):  # pragma: no cover - mmap unavailable/raced
+        pass
+    return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def list_archives(backup_dir: Path) -> list[os.DirEntry]:
+  """Archive entries sorted by name; DirEntries carry a cached stat for callers."""
+  try:
+    entries_it = os.scandir(backup_dir)
+  except FileNotFoundError:
+    return []
+  with entries_it:
+    entries = [
+      e for e in entries_it if e.name.startswith("configs-") and e.name.endswith(".tar.gz")
+    ]
+  entries.sort(key=lambda e: e.name)
+  return entries
 
 
 DEFAULT_EXCLUDES = [
@@ -86,9 +117,125 @@ DEFAULT_EXCLUDES = [
 FAST_MODE_EXTRA_EXCLUDES = ["**/logs/**"]
 
 
-def _compile_patterns(patterns: list[str]) -> list[str]:
-  # Patterns are used directly with fnmatch.fnmatchcase; normalization placeholder if needed later.
-  return patterns
+# Tar stream buffer; large enough that the compressor is fed in big writes.
+_TAR_BUFSIZE = 2 * 1024 * 1024
+
+# Backups are I/O-bound, not size-bound: gzip level 1 cuts compression CPU
+# several-fold over higher levels for roughly a 10% size penalty on config
+# trees. Applied to both the external compressor and the Python fallback.
+_GZIP_LEVEL = 1
+
+
+class _HashingWriter:
+  """Write-through file proxy that folds a hash over everything written."""
+
+  def __init__(self, f, hasher) -> None:
+    self._f = f
+    self._hasher = hasher
+
+  def write(self, data) -> int:
+    self._hasher.update(data)
+    return self._f.write(data)
+
+
+def _pump_stream(src, dst) -> None:
+  while chunk := src.read(_TAR_BUFSIZE):
+    dst.write(chunk)
+
+
+@contextlib.contextmanager
+def _open_archive_for_write(archive_path: Path, hasher=None):
+  """Yield a TarFile whose gzip-compressed output lands at ``archive_path``.
+
+  Prefers piping an uncompressed tar stream through ``pigz`` so DEFLATE runs
+  on all cores (plain ``gzip`` as second choice); falls back to Python's
+  built-in single-threaded gzip writer when neither binary is available.
+
+  When ``hasher`` is given (e.g. ``hashlib.sha256()``) it is updated with the
+  compressed bytes as they are written, so the archive checksum comes out of
+  the same pass instead of a second full read of the file.
+  """
+  compressor = shutil.which("pigz") or shutil.which("gzip")
+  if compressor is None:
+    with archive_path.open("wb") as out:
+      fileobj = _HashingWriter(out, hasher) if hasher is not None else out
+      with tarfile.open(
+        fileobj=fileobj, mode="w|gz", bufsize=_TAR_BUFSIZE, compresslevel=_GZIP_LEVEL
+      ) as tar:
+        tar.copybufsize = _TAR_BUFSIZE  # default 16 KiB copy buffer throttles big files
+        yield tar
+    return
+  with archive_path.open("wb") as out:
+    # Without a checksum the compressor writes straight to the file; with one,
+    # its stdout is pumped through the hashing proxy on a side thread.
+    proc = subprocess.Popen(
+      [compressor, "-c", f"-{_GZIP_LEVEL}"],
+      stdin=subprocess.PIPE,
+      stdout=out if hasher is None else subprocess.PIPE,
+    )
+    if proc.stdin is None:  # pragma: no cover - Popen with PIPE always sets stdin
+      raise RuntimeError("compressor subprocess has no stdin pipe")
+    pump: threading.Thread | None = None
+    if hasher is not None:
+      pump = threading.Thread(
+        target=_pump_stream, args=(proc.stdout, _HashingWriter(out, hasher)), daemon=True
+      )
+      pump.start()
+    try:
+      with tarfile.open(fileobj=proc.stdin, mode="w|", bufsize=_TAR_BUFSIZE) as tar:
+        tar.copybufsize = _TAR_BUFSIZE
+        yield tar
+    finally:
+      proc.stdin.close()
+      proc.wait()
+      if pump is not None:
+        pump.join()
+  if proc.returncode != 0:
+    raise RuntimeError(f"{compressor} exited with status {proc.returncode}")
+
+
+def _compile_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+  # Fuse all fnmatch-style globs into one alternation regex so each exclusion
+  # check is a single match instead of a per-pattern fnmatchcase loop.
+  if not patterns:
+    return None
+  return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+def _make_excluder(excl_re: re.Pattern[str] | None):
+  def is_excluded(rel_path: str) -> bool:
+    # Match path and path with trailing slash for directory semantics.
+    if excl_re is None:
+      return False
+    return bool(excl_re.match(rel_path)) or bool(excl_re.match(rel_path.rstrip("/") + "/"))
+
+  return is_excluded
+
+
+def _iter_files(dir_path: str, rel_root: str, is_excluded):
+  """Yield (DirEntry, service-relative path) for files, pruning excluded dirs.
+
+  scandir keeps the DirEntry around so the later size check reuses the stat
+  the kernel already returned during traversal instead of re-stat'ing.
+  """
+  try:
+    entries = os.scandir(dir_path)
+  except OSError:
+    return
+  with entries:
+    for entry in entries:
+      rel_path = f"{rel_root}/{entry.name}"
+      try:
+        if entry.is_dir(follow_symlinks=False):
+          if not is_excluded(rel_path.rstrip("/") + "/"):
+            yield from _iter_files(entry.path, rel_path, is_excluded)
+          continue
+        if entry.is_dir():
+          # Symlinked directory – do not descend (matches os.walk default).
+          continue
+      except OSError:
+        continue
+      yield entry, rel_path
 
 
 def create_backup(
@@ -113,65 +260,49 @@ def create_backup(
   services_done = 0
   service_list = list(services)
   size_threshold = (max_file_size_mb * 1024 * 1024) if max_file_size_mb is not None else None
-  patterns = _compile_patterns(exclude_patterns)
-
-  def is_excluded(rel_path: str) -> bool:
-    # Match path and path with trailing slash for directory semantics.
-    for pat in patterns:
-      if fnmatch.fnmatchcase(rel_path, pat) or fnmatch.fnmatchcase(rel_path.rstrip("/") + "/", pat):
-        return True
-    return False
-
+  excl_re = _compile_patterns(exclude_patterns)
+  is_excluded = _make_excluder(excl_re)
+  # Bound method in a local: the per-file check then skips closure dispatch
+  # and the rstrip allocation (file paths never end with "/").
+  excl_match = excl_re.match if excl_re is not None else None
+  hasher = hashlib.sha256() if do_checksum else None
   try:
-    with tarfile.open(archive_path, "w:gz") as tar:
+    with _open_archive_for_write(archive_path, hasher) as tar:
       for svc in service_list:
         svc_path = config_root / svc
         if not svc_path.exists():
           missing.append(str(svc_path))
           continue
-        # Walk manually so we can exclude & enforce size limits.
-        base_len = len(str(svc_path.parent)) + 1  # for relative slicing
-        for root, dirs, files in os.walk(svc_path):
-          # Derive a portable relative path (service-root-relative) without using fragile Path slicing.
-          rel_root = str(root)[base_len:].replace(os.sep, "/")
-          # Prune excluded directories in-place to prevent descending.
-          pruned_dirs: list[str] = []
-          for d in list(dirs):
-            rel_dir_path = (
-              f"{rel_root}/{d}" if rel_root else f"{svc}/{d}"
-            )  # rel_root should normally start with service name
-            if is_excluded(rel_dir_path.rstrip("/") + "/"):
-              pruned_dirs.append(d)
-          for d in pruned_dirs:
-            dirs.remove(d)
-
-          for fname in files:
-            rel_file_path = f"{rel_root}/{fname}" if rel_root else f"{svc}/{fname}"
-            if is_excluded(rel_file_path):
-              skipped_excluded += 1
-              continue
-            fpath = Path(root) / fname
-            try:
-              st = fpath.stat()
-            except FileNotFoundError:
-              # Transient disappearance (e.g., file rotated) – skip silently.
-              continue
-            if size_threshold is not None and st.st_size > size_threshold:
-              skipped_size += 1
-              continue
-            try:
-              tar.add(fpath, arcname=rel_file_path)
-              added_files += 1
-              added_bytes += st.st_size
-            except Exception:
-              # Non-fatal; skip this file.
-              continue
-            if progress and added_files % progress_interval == 0:
-              print(
-                f"… {added_files} files ({added_bytes / 1024 / 1024:.1f} MB) | "
-                f"skipped excl {skipped_excluded} size {skipped_size} | svc {services_done}/{len(service_list)}",
-                file=sys.stderr,
-              )
+        # Walk manually (scandir recursion) so we can exclude & enforce size limits.
+        for entry, rel_file_path in _iter_files(str(svc_path), svc, is_excluded):
+          if excl_match is not None and (
+            excl_match(rel_file_path) or excl_match(rel_file_path + "/")
+          ):
+            skipped_excluded += 1
+            continue
+          try:
+            # lstat flavour matches what tar.add records, and scandir has
+            # already cached it for plain files — no extra syscall.
+            st = entry.stat(follow_symlinks=False)
+          except OSError:
+            # Transient disappearance (e.g., file rotated) – skip silently.
+            continue
+          if size_threshold is not None and st.st_size > size_threshold:
+            skipped_size += 1
+            continue
+          try:
+            tar.add(entry.path, arcname=rel_file_path)
+            added_files += 1
+            added_bytes += st.st_size
+          except Exception:
+            # Non-fatal; skip this file.
+            continue
+          if progress and added_files % progress_interval == 0:
+            print(
+              f"… {added_files} files ({added_bytes / 1024 / 1024:.1f} MB) | "
+              f"skipped excl {skipped_excluded} size {skipped_size} | svc {services_done}/{len(service_list)}",
+              file=sys.stderr,
+            )
         services_done += 1
   except KeyboardInterrupt:
     # User interrupted – clean up unless keeping partial.
@@ -195,7 +326,7 @@ def create_backup(
       "No files were added to the archive (all services missing or exclusions removed everything).",
     )
 
-  checksum = sha256_file(archive_path) if do_checksum else "(skipped)"
+  checksum = hasher.hexdigest() if hasher is not None else "(skipped)"
   size_mb = archive_path.stat().st_size / 1024 / 1024
   msg_lines = [
     f"Backup created: {archive_path} ({size_mb:.2f} MB)",
@@ -210,14 +341,160 @@ def create_backup(
   return (1 if missing else 0), "\n".join(msg_lines)
 
 
-def prune_archives(backup_dir: Path, retain: int) -> list[Path]:
-  archives = list_archives(backup_dir)
-  if len(archives) <= retain:
+def _archive_one_service(
+  svc: str,
+  svc_path: Path,
+  part_path: Path,
+  *,
+  excl_re: re.Pattern[str] | None,
+  size_threshold: float | None,
+  do_checksum: bool,
+) -> tuple[int, int, int, int, str]:
+  """Create one per-service part archive; returns (files, bytes, excl, size, checksum)."""
+  added_files = 0
+  added_bytes = 0
+  skipped_excluded = 0
+  skipped_size = 0
+  is_excluded = _make_excluder(excl_re)
+  excl_match = excl_re.match if excl_re is not None else None
+  hasher = hashlib.sha256() if do_checksum else None
+  with _open_archive_for_write(part_path, hasher) as tar:
+    for entry, rel_file_path in _iter_files(str(svc_path), svc, is_excluded):
+      if excl_match is not None and (
+        excl_match(rel_file_path) or excl_match(rel_file_path + "/")
+      ):
+        skipped_excluded += 1
+        continue
+      try:
+        st = entry.stat(follow_symlinks=False)
+      except OSError:
+        continue
+      if size_threshold is not None and st.st_size > size_threshold:
+        skipped_size += 1
+        continue
+      try:
+        tar.add(entry.path, arcname=rel_file_path)
+        added_files += 1
+        added_bytes += st.st_size
+      except Exception:
+        continue
+  checksum = hasher.hexdigest() if hasher is not None else "(skipped)"
+  return added_files, added_bytes, skipped_excluded, skipped_size, checksum
+
+
+def create_backup_parallel(
+  config_root: Path,
+  backup_dir: Path,
+  services: Iterable[str],
+  *,
+  exclude_patterns: list[str],
+  max_file_size_mb: float | None,
+  do_checksum: bool,
+) -> tuple[int, str]:
+  """Archive each service into its own ``configs-<ts>-<svc>.tar.gz`` part concurrently.
+
+  Service directories are independent, and both tarfile I/O and the external
+  compressor release the GIL, so a thread pool gets near-linear scaling up to
+  min(#services, #cores). Restore parts individually with ``--restore``.
+  """
+  missing: list[str] = []
+  ts = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+  service_list = list(services)
+  size_threshold = (max_file_size_mb * 1024 * 1024) if max_file_size_mb is not None else None
+  excl_re = _compile_patterns(exclude_patterns)
+
+  jobs: dict = {}
+  results: dict[str, tuple[int, int, int, int, str]] = {}
+  part_paths: dict[str, Path] = {}
+  with ThreadPoolExecutor(max_workers=min(len(service_list) or 1, os.cpu_count() or 2)) as pool:
+    for svc in service_list:
+      svc_path = config_root / svc
+      if not svc_path.exists():
+        missing.append(str(svc_path))
+        continue
+      part_path = backup_dir / f"configs-{ts}-{svc}.tar.gz"
+      part_paths[svc] = part_path
+      jobs[
+        pool.submit(
+          _archive_one_service,
+          svc,
+          svc_path,
+          part_path,
+          excl_re=excl_re,
+          size_threshold=size_threshold,
+          do_checksum=do_checksum,
+        )
+      ] = svc
+    for fut in as_completed(jobs):
+      svc = jobs[fut]
+      try:
+        results[svc] = fut.result()
+      except Exception as e:
+        part_paths[svc].unlink(missing_ok=True)
+        return 2, f"Failed to archive {svc}: {e}"
+
+  total_files = sum(r[0] for r in results.values())
+  if total_files == 0:
+    for p in part_paths.values():
+      p.unlink(missing_ok=True)
+    return (
+      2,
+      "No files were added to any archive (all services missing or exclusions removed everything).",
+    )
+
+  msg_lines = [f"Backup parts created in {backup_dir} (timestamp {ts}):"]
+  manifest_lines: list[str] = []
+  for svc in service_list:
+    if svc not in results:
+      continue
+    files, _bytes, _excl, _size, checksum = results[svc]
+    part = part_paths[svc]
+    size_mb = part.stat().st_size / 1024 / 1024
+    msg_lines.append(f"  {part.name}\t{size_mb:.2f} MB\t{files} files")
+    if do_checksum:
+      manifest_lines.append(f"{checksum}  {part.name}")
+  if do_checksum:
+    manifest = backup_dir / f"configs-{ts}.sha256"
+    manifest.write_text("\n".join(manifest_lines) + "\n", encoding="utf-8")
+    msg_lines.append(f"Checksums: {manifest.name}")
+  if missing:
+    msg_lines.append("Missing service directories (not fatal):")
+    msg_lines.extend(f"  - {m}" for m in missing)
+  return (1 if missing else 0), "\n".join(msg_lines)
+
+
+# Everything one backup run produces: the single-mode tarball, parallel-mode
+# per-service parts, and the parallel-mode .sha256 manifest.
+_RUN_FILE_RE = re.compile(r"configs-(\d{8}-\d{6})(?:-.+)?\.(?:tar\.gz|sha256)")
+
+
+def prune_archives(backup_dir: Path, retain: int) -> list[os.DirEntry]:
+  """Delete whole backup runs beyond the newest ``retain``, oldest first.
+
+  Retention counts runs, not files: a parallel backup leaves one part per
+  service plus a manifest, all sharing one timestamp, and counting those
+  individually would let a single run crowd out (and delete) every earlier
+  backup and even its own parts. Grouping by timestamp prunes each run as a
+  unit, manifest included.
+  """
+  try:
+    entries_it = os.scandir(backup_dir)
+  except FileNotFoundError:
     return []
-  to_delete = archives[:-retain]
-  for old in to_delete:
-    old.unlink(missing_ok=True)
-  return to_delete
+  runs: defaultdict[str, list[os.DirEntry]] = defaultdict(list)
+  with entries_it:
+    for entry in entries_it:
+      if (match := _RUN_FILE_RE.fullmatch(entry.name)) is not None:
+        runs[match.group(1)].append(entry)
+  if len(runs) <= retain:
+    return []
+  deleted: list[os.DirEntry] = []
+  for ts in sorted(runs)[:-retain]:
+    for old in runs[ts]:
+      with contextlib.suppress(FileNotFoundError):
+        os.unlink(old.path)
+      deleted.append(old)
+  return deleted
 
 
 def restore_archive(backup_dir: Path, archive_name: str, target_root: Path) -> tuple[int, str]:
@@ -230,7 +507,10 @@ def restore_archive(backup_dir: Path, archive_name: str, target_root: Path) -> t
     return 2, f"Archive not found: {archive_path}"
   try:
     with tarfile.open(archive_path, "r:gz") as tar:
-      tar.extractall(path=target_root)
+      tar.copybufsize = _TAR_BUFSIZE
+      # Explicit filter: skips the 3.12+ deprecation/compat path and refuses
+      # path-traversal members outright.
+      tar.extractall(path=target_root, filter="data")
     return 0, f"Restored archive into {target_root} (NOTE: existing files overwritten)"
   except Exception as e:
     return 2, f"Restore failed: {e}"
@@ -321,6 +601,12 @@ def parse_args() -> argparse.Namespace:
     action="store_true",
     help="Skip SHA256 checksum calculation for speed",
   )
+  p.add_argument(
+    "--parallel",
+    action="store_true",
+    help="Archive each service concurrently into per-service part files "
+    "(configs-<ts>-<svc>.tar.gz + .sha256 manifest) instead of one tarball",
+  )
   return p.parse_args()
 
 
@@ -398,17 +684,27 @@ def main() -> int:
   if args.no_progress_flag:
     auto_progress = False
 
-  code, msg = create_backup(
-    config_root,
-    backup_dir,
-    args.services,
-    exclude_patterns=patterns,
-    max_file_size_mb=max_file_size,
-    progress=auto_progress,
-    progress_interval=args.progress_interval,
-    keep_partial=args.keep_partial,
-    do_checksum=not args.no_checksum,
-  )
+  if args.parallel:
+    code, msg = create_backup_parallel(
+      config_root,
+      backup_dir,
+      args.services,
+      exclude_patterns=patterns,
+      max_file_size_mb=max_file_size,
+      do_checksum=not args.no_checksum,
+    )
+  else:
+    code, msg = create_backup(
+      config_root,
+      backup_dir,
+      args.services,
+      exclude_patterns=patterns,
+      max_file_size_mb=max_file_size,
+      progress=auto_progress,
+      progress_interval=args.progress_interval,
+      keep_partial=args.keep_partial,
+      do_checksum=not args.no_checksum,
+    )
   print(("✅" if code == 0 else ("⚠️" if code == 1 else "❌")) + " " + msg)
 
   if not args.no_prune:
@@ -15,12 +15,14 @@ Usage:
 """
 
 import argparse
+import functools
 import logging
-import re
+import os
 import sqlite3
 import sys
 from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 import requests
@@ -45,15 +47,16 @@ FORMAT_PRIORITY = {
     ".txt": 5,
 }
 
-# Patterns for garbage files to exclude
-GARBAGE_PATTERNS = [
-    r"\.opf$",
-    r"\.jpg$",
-    r"\.png$",
-    r"\.xml$",
-    r"\.nfo$",
-    r"/\.",  # Hidden files
-]
+# Garbage files to exclude: metadata/sidecar extensions plus hidden files.
+# Kept as a plain tuple so is_garbage_file is a str.endswith check, not a
+# regex loop over every pattern per path.
+GARBAGE_EXTENSIONS = (".opf", ".jpg", ".png", ".xml", ".nfo")
+
+# Normalization runs per book on every scan, so it stays out of the regex
+# engine entirely: translate tables map punctuation to spaces in C, and
+# " ".join(s.split()) collapses whitespace.
+_TITLE_PUNCT_TRANS = str.maketrans(dict.fromkeys(":-,.'\"()[]", " "))
+_AUTHOR_PUNCT_TRANS = str.maketrans(dict.fromkeys(",.", " "))
 
 # =============================================================================
 # Logging Setup
@@ -95,33 +98,31 @@ def setup_logging(dry_run: bool) -> logging.Logger:
 # Utility Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
     """Normalize book title for comparison."""
     if not title:
         return ""
 
-    # Convert to lowercase
-    title = title.lower()
-
-    # Remove common punctuation and extra spaces
-    title = re.sub(r'[:\-,\.\'\"()\[\]]+', " ", title)
-    title = re.sub(r"\s+", " ", title)
-
-    # Remove common leading articles
-    title = re.sub(r"^(the|a|an)\s+", "", title)
+    # Lowercase, punctuation to spaces, collapse whitespace
+    title = " ".join(title.lower().translate(_TITLE_PUNCT_TRANS).split())
 
-    return title.strip()
+    # Remove a single common leading article
+    if title.startswith("the "):
+        return title[4:]
+    if title.startswith("an "):
+        return title[3:]
+    if title.startswith("a "):
+        return title[2:]
+    return title
 
+@functools.lru_cache(maxsize=8192)
 def normalize_author(author: str) -> str:
     """Normalize author name for comparison."""
     if not author:
         return ""
 
-    author = author.lower()
-    author = re.sub(r"[,\.]+", " ", author)
-    author = re.sub(r"\s+", " ", author)
-
-    return author.strip()
+    return " ".join(author.lower().translate(_AUTHOR_PUNCT_TRANS).split())
 
 def get_file_format_priority(filepath: str) -> int:
     """Get priority score for a file format."""
@@ -129,8 +130,8 @@ def get_file_format_priority(filepath: str) -> int:
     return FORMAT_PRIORITY.get(ext, 0)
 
 def is_garbage_file(filepath: str) -> bool:
-    """Check if file matches garbage patterns."""
-    return any(re.search(pattern, filepath) for pattern in GARBAGE_PATTERNS)
+    """Check if file is metadata/sidecar garbage or a hidden file."""
+    return filepath.endswith(GARBAGE_EXTENSIONS) or "/." in filepath
 
 def file_exists(filepath: str) -> bool:
     """Check if file exists and is a regular file."""
@@ -140,33 +141,78 @@ def file_exists(filepath: str) -> bool:
     path = Path(filepath)
     return path.exists() and path.is_file()
 
+_BOOKS_DIR_PREFIX = str(BOOKS_DIR) + "/"
+
+def scan_existing_files() -> set[str]:
+    """Walk BOOKS_DIR once and return every file path as a string set."""
+    existing: set[str] = set()
+    for root, _dirs, files in os.walk(BOOKS_DIR):
+        for fname in files:
+            existing.add(os.path.join(root, fname))
+    return existing
+
+def file_exists_fast(filepath: str, existing: set[str]) -> bool:
+    """Set-membership existence check; stats only paths outside BOOKS_DIR.
+
+    The dedup loop checks the same paths repeatedly (sort, display, delete
+    decision) — one upfront walk replaces all of those stat syscalls.
+    """
+    if not filepath:
+        return False
+    if filepath in existing:
+        return True
+    if filepath.startswith(_BOOKS_DIR_PREFIX):
+        return False
+    return file_exists(filepath)
+
 # =============================================================================
 # LazyLibrarian Database Operations
 # =============================================================================
 
-def get_all_books_from_db(logger: logging.Logger) -> list[dict]:
-    """Fetch all books from LazyLibrarian database."""
+@functools.lru_cache(maxsize=1)
+def get_db_connection() -> sqlite3.Connection:
+    """Return the shared LazyLibrarian connection, opening it on first use.
+
+    WAL + synchronous=NORMAL keeps the dedup loop's writes from paying a
+    full fsync-per-transaction, and one connection replaces the previous
+    connect/commit/close cycle per touched row.
+    """
+    conn = sqlite3.connect(LAZYLIBRARIAN_DB)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA busy_timeout=30000;"
+    )
+    return conn
+
+def get_all_books_from_db(logger: logging.Logger):
+    """Yield books from the LazyLibrarian database one row at a time.
+
+    Streaming keeps peak memory flat — rows flow straight into the grouping
+    dict instead of being materialized twice (SQLite result + Python list).
+    """
     logger.info(f"Connecting to database: {LAZYLIBRARIAN_DB}")
 
     try:
-        conn = sqlite3.connect(LAZYLIBRARIAN_DB)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = get_db_connection().cursor()
 
+        # Only the columns the dedup actually reads; no ORDER BY — grouping
+        # happens in a dict, so a DB-side sort would be wasted work.
         cursor.execute("""
-            SELECT b.BookID, a.AuthorName, b.BookName, b.BookFile, b.BookIsbn,
-                   b.BookDate, b.Status, b.BookLibrary, b.AuthorID
+            SELECT b.BookID, a.AuthorName, b.BookName, b.BookFile
             FROM books b
             LEFT JOIN authors a ON b.AuthorID = a.AuthorID
             WHERE b.BookFile IS NOT NULL AND b.BookFile != ''
-            ORDER BY a.AuthorName, b.BookName
         """)
 
-        books = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-
-        logger.info(f"Found {len(books)} books in database")
-        return books
+        for book_id, author_name, book_name, book_file in cursor:
+            yield {
+                "BookID": book_id,
+                "AuthorName": author_name,
+                "BookName": book_name,
+                "BookFile": book_file,
+            }
 
     except sqlite3.Error as e:
         logger.error(f"Database error: {e}")
@@ -179,40 +225,38 @@ def update_book_file_in_db(book_id: str, new_file: str, logger: logging.Logger,
         return
 
     try:
-        conn = sqlite3.connect(LAZYLIBRARIAN_DB)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = get_db_connection()
+        conn.execute("""
             UPDATE books SET BookFile = ? WHERE BookID = ?
         """, (new_file, book_id))
-
         conn.commit()
-        conn.close()
 
         logger.info(f"Updated BookID {book_id} to file: {new_file}")
 
     except sqlite3.Error as e:
         logger.error(f"Failed to update BookID {book_id}: {e}")
 
-def remove_book_from_db(book_id: str, logger: logging.Logger, dry_run: bool):
-    """Remove book entry from database."""
+def remove_books_from_db(book_ids: list[str], logger: logging.Logger, dry_run: bool) -> int:
+    """Remove book entries from database in one batched transaction."""
+    if not book_ids:
+        return 0
+
     if dry_run:
-        logger.info(f"[DRY RUN] Would remove BookID {book_id} from database")
-        return
+        for book_id in book_ids:
+            logger.info(f"[DRY RUN] Would remove BookID {book_id} from database")
+        return len(book_ids)
 
     try:
-        conn = sqlite3.connect(LAZYLIBRARIAN_DB)
-        cursor = conn.cursor()
+        conn = get_db_connection()
+        with conn:
+            conn.executemany("DELETE FROM books WHERE BookID = ?", [(b,) for b in book_ids])
 
-        cursor.execute("DELETE FROM books WHERE BookID = ?", (book_id,))
-
-        conn.commit()
-        conn.close()
-
-        logger.info(f"Removed BookID {book_id} from database")
+        logger.info(f"Removed {len(book_ids)} book entries from database")
+        return len(book_ids)
 
     except sqlite3.Error as e:
-        logger.error(f"Failed to remove BookID {book_id}: {e}")
+        logger.error(f"Failed to remove books: {e}")
+        return 0
 
 # =============================================================================
 # File System Operations
@@ -238,48 +282,56 @@ def delete_file(filepath: str, logger: logging.Logger, dry_run: bool):
 # Deduplication Logic
 # =============================================================================
 
-def find_duplicates(books: list[dict], logger: logging.Logger) -> dict[str, list[dict]]:
-    """Group books by normalized (author, title) to find duplicates."""
+def find_duplicates(books, logger: logging.Logger) -> tuple[dict[tuple[str, str], list[dict]], int]:
+    """Group books by normalized (author, title); returns (duplicates, total_books)."""
     groups = defaultdict(list)
+    total_books = 0
 
     for book in books:
-        author = normalize_author(book.get("AuthorName", ""))
-        title = normalize_title(book.get("BookName", ""))
+        total_books += 1
+        author = normalize_author(book.get("AuthorName") or "")
+        title = normalize_title(book.get("BookName") or "")
 
         if not author or not title:
-            logger.debug(f"Skipping book with missing author/title: {book.get('BookID')}")
+            # Lazy %-formatting: only interpolated if a DEBUG handler is active
+            logger.debug("Skipping book with missing author/title: %s", book.get("BookID"))
             continue
 
-        key = f"{author}||{title}"
-        groups[key].append(book)
+        # Tuple key — no concat on the way in, no split on the way out
+        groups[(author, title)].append(book)
+
+    logger.info(f"Found {total_books} books in database")
 
     # Filter to only groups with duplicates
     duplicates = {k: v for k, v in groups.items() if len(v) > 1}
 
     logger.info(f"Found {len(duplicates)} duplicate groups containing {sum(len(v) for v in duplicates.values())} total books")
 
-    return duplicates
+    return duplicates, total_books
 
-def select_best_format(books: list[dict], logger: logging.Logger) -> tuple[dict, list[dict]]:
+def select_best_format(
+    books: list[dict], existing: set[str], logger: logging.Logger
+) -> tuple[dict, list[dict]]:
     """
     Select the best format from a group of duplicate books.
     Returns: (keeper, list_of_duplicates_to_remove)
     """
     # Filter out books with missing files first
-    valid_books = [b for b in books if file_exists(b.get("BookFile", ""))]
+    valid_books = [b for b in books if file_exists_fast(b.get("BookFile", ""), existing)]
 
     if not valid_books:
         logger.warning("No valid files found for duplicate group")
         return (None, books)
 
-    # Sort by format priority (descending)
-    valid_books.sort(key=lambda b: get_file_format_priority(b.get("BookFile", "")), reverse=True)
+    # Sort by format priority (descending); priority was annotated once per
+    # book in the caller's display loop, so no recomputation here.
+    valid_books.sort(key=itemgetter("_priority"), reverse=True)
 
     keeper = valid_books[0]
     to_remove = valid_books[1:]
 
     # Also include books with missing files
-    missing_files = [b for b in books if not file_exists(b.get("BookFile", ""))]
+    missing_files = [b for b in books if not file_exists_fast(b.get("BookFile", ""), existing)]
     to_remove.extend(missing_files)
 
     return (keeper, to_remove)
@@ -298,33 +350,37 @@ def deduplicate_books(logger: logging.Logger, dry_run: bool) -> dict[str, int]:
     logger.info("Starting LazyLibrarian Deduplication")
     logger.info("=" * 70)
 
-    # Get all books
-    books = get_all_books_from_db(logger)
-    stats["total_books"] = len(books)
-
-    # Find duplicates
-    duplicate_groups = find_duplicates(books, logger)
+    # Stream books straight into duplicate grouping (single pass)
+    duplicate_groups, total_books = find_duplicates(get_all_books_from_db(logger), logger)
+    stats["total_books"] = total_books
     stats["duplicate_groups"] = len(duplicate_groups)
 
     if not duplicate_groups:
         logger.info("No duplicates found!")
         return stats
 
+    # One walk of the books tree replaces per-book stat syscalls below
+    existing_files = scan_existing_files()
+
+    # Collect DB removals across all groups; committed in one transaction below
+    remove_ids: list[str] = []
+
     # Process each duplicate group
     for group_key, group_books in duplicate_groups.items():
-        author, title = group_key.split("||")
+        author, title = group_key
         logger.info("")
         logger.info(f"Processing duplicate: {title.title()} by {author.title()}")
         logger.info(f"  Found {len(group_books)} copies:")
 
         for book in group_books:
             filepath = book.get("BookFile", "")
-            exists = "✓" if file_exists(filepath) else "✗"
-            priority = get_file_format_priority(filepath)
+            exists = "✓" if file_exists_fast(filepath, existing_files) else "✗"
+            # Computed once per book here; select_best_format sorts on it
+            priority = book["_priority"] = get_file_format_priority(filepath)
             logger.info(f"    {exists} [{priority:3d}] {filepath}")
 
         # Select best format
-        keeper, to_remove = select_best_format(group_books, logger)
+        keeper, to_remove = select_best_format(group_books, existing_files, logger)
 
         if keeper:
             logger.info(f"  Keeping: {keeper.get('BookFile')}")
@@ -340,13 +396,14 @@ def deduplicate_books(logger: logging.Logger, dry_run: bool) -> dict[str, int]:
             logger.info(f"  Removing duplicate: {dup_file}")
 
             # Delete file if it exists
-            if file_exists(dup_file):
+            if file_exists_fast(dup_file, existing_files):
                 delete_file(dup_file, logger, dry_run)
                 stats["files_deleted"] += 1
 
-            # Remove from database
-            remove_book_from_db(dup_id, logger, dry_run)
-            stats["db_entries_removed"] += 1
+            # Queue for batched database removal
+            remove_ids.append(dup_id)
+
+    stats["db_entries_removed"] = remove_books_from_db(remove_ids, logger, dry_run)
 
     return stats
 
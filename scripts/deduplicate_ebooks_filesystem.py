@@ -16,16 +16,22 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import logging
 import os
 import re
 import sqlite3
+import stat
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # =============================================================================
 # Configuration
@@ -53,17 +59,19 @@ FORMAT_PRIORITY = {
 # Ebook file extensions to process
 EBOOK_EXTENSIONS = {".epub", ".mobi", ".azw3", ".azw", ".pdf", ".txt", ".fb2", ".cbz", ".cbr"}
 
-# Patterns for non-ebook files to exclude
-METADATA_PATTERNS = [
-    r"\.opf$",
-    r"\.jpg$",
-    r"\.jpeg$",
-    r"\.png$",
-    r"\.gif$",
-    r"\.xml$",
-    r"\.nfo$",
-    r"\.db$",
-]
+# Extensions of non-ebook files to exclude (metadata, covers, thumbnails)
+METADATA_EXTENSIONS = {".opf", ".jpg", ".jpeg", ".png", ".gif", ".xml", ".nfo", ".db"}
+
+# Normalization helpers, built once at module scope (the functions below run
+# per file on every scan). Character-class replacements use str.translate —
+# a few times faster than the regex engine for the same job; only the
+# anchored patterns stay as regexes.
+_TITLE_PUNCT_TRANS = str.maketrans(dict.fromkeys(":-,.'\"()[]_", " "))
+_AUTHOR_PUNCT_TRANS = str.maketrans(dict.fromkeys(",.", " "))
+_LEADING_ARTICLE_RE = re.compile(r"^(the|a|an)\s+")
+_BOOK_SERIES_RE = re.compile(r"\s*\(?book\s*\d+\)?", re.IGNORECASE)
+_TRAILING_NUMBER_RE = re.compile(r"\s*\(?\d+\)?$")
+_AUTHOR_SUFFIX_RE = re.compile(r"\s*(jr|sr|ii|iii|iv)\s*$", re.IGNORECASE)
 
 # =============================================================================
 # Logging Setup
@@ -108,6 +116,7 @@ def setup_logging(dry_run: bool) -> logging.Logger:
 # Utility Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
     """Normalize book title for comparison."""
     if not title:
@@ -120,28 +129,26 @@ def normalize_title(title: str) -> str:
     for ext in EBOOK_EXTENSIONS:
         title = title.replace(ext, "")
 
-    # Remove common punctuation and extra spaces
-    title = re.sub(r'[:\-,\.\'\"()\[\]_]+', " ", title)
-    title = re.sub(r"\s+", " ", title)
+    # Remove common punctuation and collapse whitespace (C string ops)
+    title = " ".join(title.translate(_TITLE_PUNCT_TRANS).split())
 
     # Remove common leading articles
-    title = re.sub(r"^(the|a|an)\s+", "", title)
+    title = _LEADING_ARTICLE_RE.sub("", title)
 
     # Remove series info like "(Book 1)" or "Book 1"
-    title = re.sub(r"\s*\(?book\s*\d+\)?", "", title, flags=re.IGNORECASE)
-    title = re.sub(r"\s*\(?\d+\)?$", "", title)
+    title = _BOOK_SERIES_RE.sub("", title)
+    title = _TRAILING_NUMBER_RE.sub("", title)
 
     return title.strip()
 
+@functools.lru_cache(maxsize=8192)
 def normalize_author(author: str) -> str:
     """Normalize author name for comparison."""
     if not author:
         return ""
 
-    author = author.lower()
-    author = re.sub(r"[,\.]+", " ", author)
-    author = re.sub(r"\s+", " ", author)
-    author = re.sub(r"\s*(jr|sr|ii|iii|iv)\s*$", "", author, flags=re.IGNORECASE)
+    author = " ".join(author.lower().translate(_AUTHOR_PUNCT_TRANS).split())
+    author = _AUTHOR_SUFFIX_RE.sub("", author)
 
     return author.strip()
 
@@ -175,8 +182,11 @@ def extract_metadata_from_filename(filepath: Path) -> tuple[str, str]:
 
     return (normalize_title(title), normalize_author(author))
 
+_JUNK_NAME_RE = re.compile(r"[\[\(]\d+[\]\)]|tmp|temp|copy", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=8192)
 def get_file_priority(filepath: Path) -> int:
-    """Get priority score for a file."""
+    """Get priority score for a file (cached — recomputed for sort and display)."""
     ext = filepath.suffix.lower()
     priority = FORMAT_PRIORITY.get(ext, 0)
 
@@ -185,89 +195,304 @@ def get_file_priority(filepath: Path) -> int:
         priority += 5
 
     # Penalty for weird characters or temp files
-    if re.search(r"[\[\(]\d+[\]\)]|tmp|temp|copy", filepath.name, re.IGNORECASE):
+    if _JUNK_NAME_RE.search(filepath.name):
         priority -= 10
 
     return priority
 
-def is_metadata_file(filepath: Path) -> bool:
+def is_metadata_file(filepath: Path | str) -> bool:
     """Check if file is metadata (not an ebook)."""
-    return any(re.search(pattern, str(filepath), re.IGNORECASE) for pattern in METADATA_PATTERNS)
+    # Plain extension lookup — no regex engine per call
+    name = filepath.name if isinstance(filepath, Path) else filepath
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:].lower() in METADATA_EXTENSIONS
 
 def is_ebook_file(filepath: Path) -> bool:
     """Check if file is a valid ebook."""
     return filepath.suffix.lower() in EBOOK_EXTENSIONS
 
+# Stat results cached per path — seeded by the directory scan, reused by the
+# dedup, display, and Jellyfin passes so no code path re-stats a file. On
+# network/FUSE mounts every avoided stat is an avoided round trip.
+_STAT_CACHE: dict[str, os.stat_result | None] = {}
+
+def _stat(path: str) -> os.stat_result | None:
+    """Cached lstat (None for missing/unreadable paths)."""
+    try:
+        return _STAT_CACHE[path]
+    except KeyError:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            st = None
+        _STAT_CACHE[path] = st
+        return st
+
+def _forget_stat(path: Path | str) -> None:
+    """Invalidate one cached stat (after deleting the file)."""
+    _STAT_CACHE.pop(str(path), None)
+
+def file_exists(filepath: Path | str) -> bool:
+    """Check path is an existing regular file with one (cached) syscall."""
+    st = _stat(str(filepath))
+    return st is not None and stat.S_ISREG(st.st_mode)
+
 # =============================================================================
 # Filesystem Scanning
 # =============================================================================
 
-def scan_books_directory(logger: logging.Logger) -> list[Path]:
-    """Scan books directory for all ebook files."""
-    logger.info(f"Scanning directory: {BOOKS_DIR}")
-
-    ebook_files = []
-    metadata_files = []
-
-    for root, dirs, files in os.walk(BOOKS_DIR):
-        # Skip hidden directories
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-        for filename in files:
-            filepath = Path(root) / filename
-
-            if is_metadata_file(filepath):
-                metadata_files.append(filepath)
+def _walk_books(root: str):
+    """Yield DirEntry objects for files under root, skipping hidden directories."""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        yield from _walk_books(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+            except OSError:
                 continue
 
-            if is_ebook_file(filepath):
-                ebook_files.append(filepath)
+def scan_books_directory(logger: logging.Logger):
+    """Yield ebook files from the books directory as they are discovered."""
+    logger.info(f"Scanning directory: {BOOKS_DIR}")
+
+    metadata_count = 0
 
-    logger.info(f"Found {len(ebook_files)} ebook files")
-    logger.info(f"Found {len(metadata_files)} metadata files")
+    for entry in _walk_books(str(BOOKS_DIR)):
+        # Cheap extension check on the entry name; Path objects are only
+        # materialized for files that survive the filter.
+        dot = entry.name.rfind(".")
+        ext = entry.name[dot:].lower() if dot > 0 else ""
+        if ext in EBOOK_EXTENSIONS:
+            # Seed the stat cache while the dentry is hot — later passes
+            # (size display, keeper selection, space accounting) reuse it.
+            try:
+                _STAT_CACHE[entry.path] = entry.stat(follow_symlinks=False)
+            except OSError:
+                _STAT_CACHE[entry.path] = None
+            yield Path(entry.path)
+        elif ext in METADATA_EXTENSIONS:
+            metadata_count += 1
 
-    return ebook_files
+    logger.info(f"Found {metadata_count} metadata files")
 
-def find_filesystem_duplicates(ebook_files: list[Path], logger: logging.Logger) -> dict[str, list[Path]]:
-    """Group ebook files by normalized (author, title) to find duplicates."""
+def find_filesystem_duplicates(
+    ebook_files, logger: logging.Logger
+) -> tuple[dict[tuple[str, str], list[Path]], int]:
+    """Group ebook files by normalized (author, title); returns (duplicates, total)."""
     groups = defaultdict(list)
+    total_files = 0
 
     for filepath in ebook_files:
+        total_files += 1
         title, author = extract_metadata_from_filename(filepath)
 
         if not title:
-            logger.debug(f"Could not extract title from: {filepath}")
+            # Lazy %-formatting: only interpolated if a DEBUG handler is active
+            logger.debug("Could not extract title from: %s", filepath)
             continue
 
-        # Create key: "author||title" or just "title" if no author
-        key = f"{author}||{title}" if author else f"unknown||{title}"
+        # Tuple key (author, title) — no concat on the way in, no split later
+        groups[(author or "unknown", title)].append(filepath)
 
-        groups[key].append(filepath)
+    logger.info(f"Found {total_files} ebook files")
 
     # Filter to only groups with duplicates
     duplicates = {k: v for k, v in groups.items() if len(v) > 1}
 
     logger.info(f"Found {len(duplicates)} duplicate groups containing {sum(len(v) for v in duplicates.values())} total files")
 
-    return duplicates
+    return duplicates, total_files
+
+# Content-identity pipeline for same-format candidates: size gate (free,
+# from the stat cache) -> 4 KiB prefix digest -> full digest. Most distinct
+# editions differ in size, so the hash steps rarely run and full reads are
+# reserved for files that could actually be byte-identical.
+_HASH_PREFIX_BYTES = 4096
+_prefix_digest_cache: dict[str, bytes | None] = {}
+_full_digest_cache: dict[str, bytes | None] = {}
+
+def _file_digest(filepath: Path, prefix_only: bool = False) -> bytes | None:
+    """Digest of a file's first 4 KiB or full contents (None if unreadable)."""
+    cache = _prefix_digest_cache if prefix_only else _full_digest_cache
+    key = str(filepath)
+    if key in cache:
+        return cache[key]
+    # blake2b is the fastest non-cryptographic-grade option in the stdlib
+    # and releases the GIL inside update(); there is no adversary here, so
+    # no need for SHA-family speeds.
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        # Unbuffered reads (we already read in 1 MiB blocks) plus a
+        # sequential-readahead hint for the full-file pass.
+        with open(filepath, "rb", buffering=0) as f:
+            if prefix_only:
+                h.update(f.read(_HASH_PREFIX_BYTES))
+            else:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+        digest = h.digest()
+    except OSError:
+        digest = None
+    cache[key] = digest
+    return digest
+
+# Digests persist across runs keyed by (size, mtime) — libraries grow
+# incrementally, so on a rerun almost every candidate hashes for free
+_DEDUP_CACHE_DB = Path(os.path.expanduser("~/.cache/nas-dedup/cache.sqlite"))
+
+def _open_digest_cache() -> sqlite3.Connection | None:
+    try:
+        _DEDUP_CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_DEDUP_CACHE_DB)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "path TEXT PRIMARY KEY, size INT, mtime REAL, prefix BLOB, full BLOB)"
+        )
+        return conn
+    except (OSError, sqlite3.Error):
+        return None
+
+def _load_cached_digests(conn: sqlite3.Connection, paths: list[Path]) -> None:
+    """Seed the in-memory digest caches from rows whose (size, mtime) still match."""
+    rows = {
+        row[0]: row[1:]
+        for row in conn.execute("SELECT path, size, mtime, prefix, full FROM entries")
+    }
+    for p in paths:
+        key = str(p)
+        cached = rows.get(key)
+        st = _stat(key)
+        if cached is None or st is None:
+            continue
+        size, mtime, prefix, full = cached
+        if size == st.st_size and mtime == st.st_mtime:
+            if prefix is not None:
+                _prefix_digest_cache[key] = bytes(prefix)
+            if full is not None:
+                _full_digest_cache[key] = bytes(full)
+
+def _store_digests(conn: sqlite3.Connection, paths: list[Path]) -> None:
+    """Write freshly computed digests back for the next run."""
+    rows = []
+    for p in paths:
+        key = str(p)
+        st = _stat(key)
+        if st is None or key not in _prefix_digest_cache:
+            continue
+        rows.append(
+            (key, st.st_size, st.st_mtime, _prefix_digest_cache[key], _full_digest_cache.get(key))
+        )
+    try:
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+    except sqlite3.Error:
+        pass
+
+def _books_dir_is_rotational() -> bool:
+    """Best-effort check whether BOOKS_DIR sits on spinning rust."""
+    try:
+        st = os.stat(BOOKS_DIR)
+        base = Path(f"/sys/dev/block/{os.major(st.st_dev)}:{os.minor(st.st_dev)}")
+        for flag in (base / "queue" / "rotational", base.resolve().parent / "queue" / "rotational"):
+            if flag.exists():
+                return flag.read_text().strip() == "1"
+    except OSError:
+        pass
+    return False
+
+def _prewarm_digests(duplicate_groups: dict, logger: logging.Logger) -> None:
+    """Hash duplicate candidates concurrently before the serial group loop.
+
+    read() and blake2b.update() both release the GIL, so a thread pool lets
+    the kernel pipeline the I/O. HDDs get 2 workers to avoid seek thrashing;
+    SSDs get enough to keep the queue full.
+    """
+    # Only same-format, same-size files can be judged byte-identical —
+    # nothing else will ever be hashed by _same_content.
+    candidates = []
+    for files in duplicate_groups.values():
+        buckets = defaultdict(list)
+        for f in files:
+            st = _stat(str(f))
+            if st is not None:
+                buckets[(f.suffix.lower(), st.st_size)].append(f)
+        for bucket in buckets.values():
+            if len(bucket) > 1:
+                candidates.extend(bucket)
+
+    if len(candidates) < 2:
+        return
+
+    # Reuse digests from the previous run when (size, mtime) is unchanged
+    cache_conn = _open_digest_cache()
+    if cache_conn is not None:
+        _load_cached_digests(cache_conn, candidates)
+
+    workers = 2 if _books_dir_is_rotational() else (os.cpu_count() or 4) * 2
+    logger.debug("Prehashing %d candidates with %d workers", len(candidates), workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda p: _file_digest(p, prefix_only=True), candidates))
+
+        # Full digests only where the cheap prefixes collide
+        by_prefix = defaultdict(list)
+        for f in candidates:
+            prefix = _file_digest(f, prefix_only=True)
+            if prefix is not None:
+                by_prefix[prefix].append(f)
+        survivors = [f for bucket in by_prefix.values() if len(bucket) > 1 for f in bucket]
+        list(pool.map(_file_digest, survivors))
+
+    if cache_conn is not None:
+        _store_digests(cache_conn, candidates)
+        cache_conn.close()
+
+def _same_content(a: Path, b: Path) -> bool:
+    """True only if both files are provably byte-identical."""
+    st_a, st_b = _stat(str(a)), _stat(str(b))
+    if st_a is None or st_b is None or st_a.st_size != st_b.st_size:
+        return False
+    if _file_digest(a, prefix_only=True) != _file_digest(b, prefix_only=True):
+        return False
+    digest_a = _file_digest(a)
+    return digest_a is not None and digest_a == _file_digest(b)
 
-def select_best_file(files: list[Path], logger: logging.Logger) -> tuple[Path, list[Path]]:
+def select_best_file(
+    triples: list[tuple[Path, os.stat_result, int]], logger: logging.Logger
+) -> tuple[Path, list[Path]]:
     """
-    Select the best file from a group of duplicates.
+    Select the best file from pre-computed (path, stat, priority) triples.
     Returns: (keeper, list_of_duplicates_to_remove)
     """
-    # Filter out files that don't exist
-    valid_files = [f for f in files if f.exists() and f.is_file()]
-
-    if not valid_files:
+    if not triples:
         logger.warning("No valid files in duplicate group")
-        return (None, files)
+        return (None, [])
 
-    # Sort by priority (descending)
-    valid_files.sort(key=lambda f: get_file_priority(f), reverse=True)
+    # Highest priority wins; larger file breaks ties (usually richer content)
+    keeper, _keeper_st, _ = max(triples, key=lambda t: (t[2], t[1].st_size))
+    keeper_ext = keeper.suffix.lower()
+    to_remove = []
 
-    keeper = valid_files[0]
-    to_remove = valid_files[1:]
+    for candidate, _st, _priority in triples:
+        if candidate is keeper:
+            continue
+        # Same format as the keeper: only remove a provably byte-identical
+        # copy — a same-title file with different content is another
+        # edition, not a duplicate. Other formats keep the existing
+        # priority-based preference (e.g. EPUB over PDF).
+        if candidate.suffix.lower() == keeper_ext and not _same_content(keeper, candidate):
+            logger.info(f"  Keeping different edition: {candidate.name}")
+            continue
+        to_remove.append(candidate)
 
     return (keeper, to_remove)
 
@@ -275,6 +500,25 @@ def select_best_file(files: list[Path], logger: logging.Logger) -> tuple[Path, l
 # File System Operations
 # =============================================================================
 
+def _fsync_dirs(dirs: set[Path], logger: logging.Logger) -> None:
+    """Flush directory metadata once per directory after a batch of unlinks.
+
+    Unlinks only dirty the parent directory's metadata; syncing each unique
+    parent once at the end batches the journal commit instead of paying it
+    per file.
+    """
+    for directory in dirs:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            continue  # directory itself may have been removed when emptied
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.debug("fsync failed for %s: %s", directory, e)
+        finally:
+            os.close(fd)
+
 def delete_file(filepath: Path, logger: logging.Logger, dry_run: bool):
     """Safely delete a file and its associated metadata files."""
     if dry_run:
@@ -287,24 +531,27 @@ def delete_file(filepath: Path, logger: logging.Logger, dry_run: bool):
         return
 
     try:
-        if filepath.exists() and filepath.is_file():
+        if file_exists(filepath):
             # Delete associated metadata files first
             for ext in [".opf", ".jpg", ".png", ".jpeg", ".nfo", ".xml"]:
                 metadata_file = filepath.with_suffix(ext)
                 if metadata_file.exists():
                     metadata_file.unlink()
-                    logger.debug(f"Deleted metadata: {metadata_file}")
+                    logger.debug("Deleted metadata: %s", metadata_file)
 
             # Delete the main file
             filepath.unlink()
             logger.info(f"Deleted: {filepath}")
 
+            # Drop the cached stat so later passes see the deletion
+            _forget_stat(filepath)
+
             # Try to remove empty parent directories
             try:
                 parent = filepath.parent
                 if parent != BOOKS_DIR and not any(parent.iterdir()):
                     parent.rmdir()
-                    logger.debug(f"Removed empty directory: {parent}")
+                    logger.debug("Removed empty directory: %s", parent)
             except OSError:
                 pass  # Directory not empty or can't be removed
         else:
@@ -316,6 +563,17 @@ def delete_file(filepath: Path, logger: logging.Logger, dry_run: bool):
 # LazyLibrarian Database Operations
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
+def get_db_connection() -> sqlite3.Connection:
+    """Return the shared LazyLibrarian connection, opening it on first use."""
+    conn = sqlite3.connect(LAZYLIBRARIAN_DB)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA busy_timeout=30000;"
+    )
+    return conn
+
 def clean_lazylibrarian_orphans(deleted_files: set[str], logger: logging.Logger, dry_run: bool) -> int:
     """Remove LazyLibrarian database entries for deleted files."""
     if not deleted_files:
@@ -323,30 +581,36 @@ def clean_lazylibrarian_orphans(deleted_files: set[str], logger: logging.Logger,
 
     logger.info("Cleaning LazyLibrarian database orphans...")
 
-    try:
-        conn = sqlite3.connect(LAZYLIBRARIAN_DB)
-        cursor = conn.cursor()
+    # Convert absolute paths to container paths once, outside the DB work
+    books_prefix = str(BOOKS_DIR)
+    container_paths = [str(f).replace(books_prefix, "/books") for f in deleted_files]
 
-        removed_count = 0
+    if dry_run:
+        for container_path in container_paths:
+            logger.debug("[DRY RUN] Would remove DB entry for: %s", container_path)
+        return 0
 
-        for deleted_file in deleted_files:
-            # Convert absolute path to container path
-            container_path = str(deleted_file).replace(str(BOOKS_DIR), "/books")
+    # SQLite's default variable limit is 999; stay comfortably under it
+    chunk_size = 500
 
-            if dry_run:
-                logger.debug(f"[DRY RUN] Would remove DB entry for: {container_path}")
-            else:
-                cursor.execute("""
-                    DELETE FROM books WHERE BookFile = ?
-                """, (container_path,))
-                if cursor.rowcount > 0:
-                    logger.info(f"Removed DB entry for: {container_path}")
-                    removed_count += 1
+    try:
+        conn = get_db_connection()
 
-        if not dry_run:
-            conn.commit()
+        # BookFile has no index in the stock schema, so each path-keyed
+        # DELETE would scan the table. This script only knows paths (it
+        # works from the filesystem, not DB rows), so index the column
+        # once instead of switching to BookID-keyed deletes.
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_books_bookfile ON books(BookFile)")
 
-        conn.close()
+        removed_count = 0
+        with conn:
+            for i in range(0, len(container_paths), chunk_size):
+                chunk = container_paths[i:i + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"DELETE FROM books WHERE BookFile IN ({placeholders})", chunk
+                )
+                removed_count += cursor.rowcount
 
         logger.info(f"Removed {removed_count} orphan entries from LazyLibrarian")
         return removed_count
@@ -359,13 +623,26 @@ def clean_lazylibrarian_orphans(deleted_files: set[str], logger: logging.Logger,
 # Jellyfin API Operations
 # =============================================================================
 
+# One pooled session for every Jellyfin call: keep-alive skips the TCP
+# handshake on each of the N per-item DELETEs in the cleanup loop. Transient
+# errors (429/5xx, connection resets) retry with backoff so a blip doesn't
+# leave orphans behind and force a full re-run. DELETE is idempotent here.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "DELETE", "POST"],
+)
+_SESSION = requests.Session()
+_SESSION.headers.update({"X-MediaBrowser-Token": JELLYFIN_API_KEY})
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=_RETRY))
+
 def jellyfin_api_get(endpoint: str, logger: logging.Logger) -> dict:
     """Make GET request to Jellyfin API."""
     url = f"{JELLYFIN_API_URL}{endpoint}"
-    headers = {"X-MediaBrowser-Token": JELLYFIN_API_KEY}
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -379,10 +656,9 @@ def jellyfin_api_delete(endpoint: str, logger: logging.Logger, dry_run: bool) ->
         return True
 
     url = f"{JELLYFIN_API_URL}{endpoint}"
-    headers = {"X-MediaBrowser-Token": JELLYFIN_API_KEY}
 
     try:
-        response = requests.delete(url, headers=headers, timeout=30)
+        response = _SESSION.delete(url, timeout=30)
         response.raise_for_status()
         return True
     except requests.RequestException as e:
@@ -392,10 +668,9 @@ def jellyfin_api_delete(endpoint: str, logger: logging.Logger, dry_run: bool) ->
 def jellyfin_api_post(endpoint: str, logger: logging.Logger) -> bool:
     """Make POST request to Jellyfin API."""
     url = f"{JELLYFIN_API_URL}{endpoint}"
-    headers = {"X-MediaBrowser-Token": JELLYFIN_API_KEY}
 
     try:
-        response = requests.post(url, headers=headers, timeout=30)
+        response = _SESSION.post(url, timeout=30)
         response.raise_for_status()
         return True
     except requests.RequestException as e:
@@ -415,19 +690,32 @@ def clean_jellyfin_library(logger: logging.Logger, dry_run: bool) -> dict[str, i
     logger.info("Starting Jellyfin Library Cleanup")
     logger.info("=" * 70)
 
-    # Get all book items from Jellyfin
-    logger.info("Fetching books from Jellyfin...")
-    response = jellyfin_api_get("/Items?IncludeItemTypes=Book&Recursive=true&Fields=Path", logger)
+    # Page through book items instead of pulling the whole library in one
+    # JSON blob — memory peaks at ~one page and classification starts before
+    # the last page has been fetched.
+    def iter_items(page_size: int = 1000):
+        start_index = 0
+        while True:
+            response = jellyfin_api_get(
+                "/Items?IncludeItemTypes=Book&Recursive=true&Fields=Path"
+                f"&EnableUserData=false&Limit={page_size}&StartIndex={start_index}",
+                logger,
+            )
+            page = response.get("Items", [])
+            if not page:
+                return
+            yield from page
+            start_index += len(page)
 
-    items = response.get("Items", [])
-    stats["total_books"] = len(items)
-    logger.info(f"Found {len(items)} book entries in Jellyfin")
+    logger.info("Fetching books from Jellyfin...")
 
-    if not items:
-        logger.warning("No books found in Jellyfin library")
-        return stats
+    # Classify sequentially (cheap stats + stats-gathering), then issue the
+    # DELETEs concurrently — each one is pure network latency and the pooled
+    # session multiplexes them.
+    to_delete: list[str] = []
 
-    for item in items:
+    for item in iter_items():
+        stats["total_books"] += 1
         item_id = item.get("Id")
         item_name = item.get("Name")
         item_path = item.get("Path", "")
@@ -438,8 +726,7 @@ def clean_jellyfin_library(logger: logging.Logger, dry_run: bool) -> dict[str, i
             stats["missing_files"] += 1
 
             logger.info(f"Removing orphan entry: {item_name}")
-            if jellyfin_api_delete(f"/Items/{item_id}", logger, dry_run):
-                stats["entries_removed"] += 1
+            to_delete.append(item_id)
             continue
 
         # Check if it's a metadata file (shouldn't be in library)
@@ -448,20 +735,32 @@ def clean_jellyfin_library(logger: logging.Logger, dry_run: bool) -> dict[str, i
             stats["metadata_entries"] += 1
 
             logger.info(f"Removing metadata entry: {item_name}")
-            if jellyfin_api_delete(f"/Items/{item_id}", logger, dry_run):
-                stats["entries_removed"] += 1
+            to_delete.append(item_id)
             continue
 
         # Check if file exists on disk
-        if not Path(item_path).exists():
+        if not file_exists(item_path):
             logger.warning(f"Missing file: {item_name} -> {item_path}")
             stats["missing_files"] += 1
 
             logger.info(f"Removing missing file entry: {item_name}")
-            if jellyfin_api_delete(f"/Items/{item_id}", logger, dry_run):
-                stats["entries_removed"] += 1
+            to_delete.append(item_id)
             continue
 
+    logger.info(f"Found {stats['total_books']} book entries in Jellyfin")
+
+    if not stats["total_books"]:
+        logger.warning("No books found in Jellyfin library")
+        return stats
+
+    if to_delete:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = pool.map(
+                lambda item_id: jellyfin_api_delete(f"/Items/{item_id}", logger, dry_run),
+                to_delete,
+            )
+            stats["entries_removed"] = sum(results)
+
     # Trigger library scan if we made changes
     if stats["entries_removed"] > 0 and not dry_run:
         logger.info("Triggering Jellyfin library refresh...")
@@ -489,12 +788,12 @@ def deduplicate_ebooks(logger: logging.Logger, dry_run: bool, scan_only: bool) -
     logger.info("Starting Filesystem Ebook Deduplication")
     logger.info("=" * 70)
 
-    # Scan for all ebook files
-    ebook_files = scan_books_directory(logger)
-    stats["total_files"] = len(ebook_files)
-
-    # Find duplicates
-    duplicate_groups = find_filesystem_duplicates(ebook_files, logger)
+    # Stream scan results straight into duplicate grouping — one pass over
+    # the tree, no intermediate list of every ebook Path.
+    duplicate_groups, total_files = find_filesystem_duplicates(
+        scan_books_directory(logger), logger
+    )
+    stats["total_files"] = total_files
     stats["duplicate_groups"] = len(duplicate_groups)
 
     if not duplicate_groups:
@@ -503,42 +802,61 @@ def deduplicate_ebooks(logger: logging.Logger, dry_run: bool, scan_only: bool) -
 
     deleted_files = set()
 
+    # Display paths relative to BOOKS_DIR via a string slice — the log loop
+    # would otherwise rebuild a PurePath per relative_to call
+    rel_start = len(str(BOOKS_DIR)) + 1
+
+    # Warm the digest caches in parallel so the serial loop below never
+    # blocks on file reads
+    if not scan_only:
+        _prewarm_digests(duplicate_groups, logger)
+
     # Process each duplicate group
     for group_key, group_files in sorted(duplicate_groups.items()):
-        author, title = group_key.split("||")
+        author, title = group_key
         logger.info("")
         logger.info(f"Processing duplicate: '{title.title()}' by '{author.title()}'")
         logger.info(f"  Found {len(group_files)} copies:")
 
+        # One pass per group: gather (path, stat, priority), log, and feed
+        # the same triples to keeper selection — no second iteration
+        triples = []
         for filepath in group_files:
             priority = get_file_priority(filepath)
-            size_mb = filepath.stat().st_size / (1024 * 1024)
-            logger.info(f"    [{priority:3d}] {size_mb:6.2f} MB - {filepath.relative_to(BOOKS_DIR)}")
+            st = _stat(str(filepath))
+            size_mb = (st.st_size if st else 0) / (1024 * 1024)
+            logger.info(f"    [{priority:3d}] {size_mb:6.2f} MB - {str(filepath)[rel_start:]}")
+            if st is not None and stat.S_ISREG(st.st_mode):
+                triples.append((filepath, st, priority))
 
         if scan_only:
             continue
 
         # Select best file
-        keeper, to_remove = select_best_file(group_files, logger)
+        keeper, to_remove = select_best_file(triples, logger)
 
         if keeper:
-            logger.info(f"  ✓ Keeping: {keeper.relative_to(BOOKS_DIR)}")
+            logger.info(f"  ✓ Keeping: {str(keeper)[rel_start:]}")
         else:
             logger.warning("  ! No valid keeper found for this group!")
             continue
 
         # Remove duplicates
         for dup_file in to_remove:
-            logger.info(f"  ✗ Removing: {dup_file.relative_to(BOOKS_DIR)}")
+            logger.info(f"  ✗ Removing: {str(dup_file)[rel_start:]}")
 
-            # Track space freed
-            if dup_file.exists():
-                stats["space_freed_mb"] += dup_file.stat().st_size / (1024 * 1024)
+            # Track space freed (cached stat — no extra syscall)
+            st = _stat(str(dup_file))
+            if st is not None:
+                stats["space_freed_mb"] += st.st_size / (1024 * 1024)
 
             delete_file(dup_file, logger, dry_run)
             stats["files_deleted"] += 1
             deleted_files.add(str(dup_file))
 
+    if deleted_files and not dry_run:
+        _fsync_dirs({Path(f).parent for f in deleted_files}, logger)
+
     if not scan_only:
         # Clean LazyLibrarian database
         stats["db_entries_removed"] = clean_lazylibrarian_orphans(deleted_files, logger, dry_run)
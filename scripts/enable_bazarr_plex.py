@@ -12,6 +12,13 @@ from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built against it (5-10x
+# faster on sizeable configs); fall back to the pure-Python classes
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 
 def update_bazarr_config(config_path: Path, plex_token: str, plex_url: str = "http://plex:32400") -> None:
     """
@@ -28,7 +35,7 @@ def update_bazarr_config(config_path: Path, plex_token: str, plex_url: str = "ht
 
     # Read existing config
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
 
     # Update general settings to enable Plex
     if "general" not in config:
@@ -50,12 +57,12 @@ def update_bazarr_config(config_path: Path, plex_token: str, plex_url: str = "ht
     backup_path = config_path.with_suffix(".yaml.bak")
     print(f"Creating backup at {backup_path}")
     with open(backup_path, "w") as f:
-        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
     # Write updated config
     print(f"Updating {config_path}")
     with open(config_path, "w") as f:
-        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
     print("✓ Plex integration enabled in Bazarr")
     print(f"  - Plex URL: {plex_url}")
@@ -3,14 +3,18 @@
 Monitor and enforce critical Radarr settings that affect folder naming.
 This prevents AutoConfig or manual changes from breaking naming again.
 """
-import json
 import sys
 import os
-import subprocess
+import requests
 
 RADARR_API_KEY = os.getenv("API_KEY_RADARR")
 RADARR_URL = "http://localhost:7878"
 
+# Shared session: one TCP connection reused across all API calls instead of
+# a curl fork/exec + fresh connect per request (this runs from cron)
+_SESSION = requests.Session()
+_SESSION.headers["X-Api-Key"] = RADARR_API_KEY or ""
+
 REQUIRED_SETTINGS = {
     "naming": {
         "movieFolderFormat": "{Movie Collection}{Movie Collection: - }{Movie CleanTitleThe} ({Release Year})",
@@ -23,21 +27,16 @@ REQUIRED_SETTINGS = {
 
 def get_radarr_config(endpoint: str) -> dict:
     """Fetch config from Radarr API."""
-    cmd = ["curl", "-s", "-H", f"X-Api-Key: {RADARR_API_KEY}", f"{RADARR_URL}/api/v3/config/{endpoint}"]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return json.loads(result.stdout)
+    response = _SESSION.get(f"{RADARR_URL}/api/v3/config/{endpoint}", timeout=5)
+    response.raise_for_status()
+    return response.json()
 
 def set_radarr_config(endpoint: str, data: dict) -> bool:
     """Update config via Radarr API."""
-    cmd = [
-        "curl", "-s", "-X", "PUT",
-        "-H", f"X-Api-Key: {RADARR_API_KEY}",
-        "-H", "Content-Type: application/json",
-        f"{RADARR_URL}/api/v3/config/{endpoint}",
-        "--data-raw", json.dumps(data)
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode == 0
+    try:
+        return _SESSION.put(f"{RADARR_URL}/api/v3/config/{endpoint}", json=data, timeout=5).ok
+    except requests.RequestException:
+        return False
 
 def main() -> int:
     """Validate and enforce critical Radarr settings."""
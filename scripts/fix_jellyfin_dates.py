@@ -21,43 +21,46 @@ def fix_movie_dates(db_path: Path, dry_run: bool = True) -> None:
     conn = sqlite3.connect(str(db_path))
     cursor = conn.cursor()
 
-    # Get movies where DateCreated != DateLastRefreshed
+    # Preview: only the top 20 ever get printed, so only fetch those
     query = """
-        SELECT Id, Name, DateCreated, DateLastRefreshed
+        SELECT Name, DateCreated, DateLastRefreshed
         FROM BaseItems
         WHERE IsMovie = 1
         AND DateLastRefreshed IS NOT NULL
         ORDER BY DateLastRefreshed DESC
+        LIMIT 20
     """
 
     cursor.execute(query)
     movies = cursor.fetchall()
 
-    print(f"Found {len(movies)} movies")
     print(f"\n{'DRY RUN - ' if dry_run else ''}Top 20 movies by scan date:")
     print("-" * 80)
 
-    updated_count = 0
-    for i, (movie_id, name, date_created, date_refreshed) in enumerate(movies[:20]):
+    for i, (name, date_created, date_refreshed) in enumerate(movies):
         print(f"{i+1}. {name}")
         print(f"   Current DateCreated: {date_created}")
         print(f"   DateLastRefreshed:   {date_refreshed}")
 
         if date_created != date_refreshed:
-            if not dry_run:
-                update_query = """
-                    UPDATE BaseItems
-                    SET DateCreated = ?
-                    WHERE Id = ?
-                """
-                cursor.execute(update_query, (date_refreshed, movie_id))
-                updated_count += 1
-            print("   -> Would update" if dry_run else "   -> UPDATED")
+            print("   -> Would update" if dry_run else "   -> will update")
         else:
             print("   -> Already correct")
         print()
 
     if not dry_run:
+        # One server-side UPDATE instead of a Python loop issuing a
+        # statement per row — SQLite touches only the mismatched rows
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("""
+            UPDATE BaseItems
+            SET DateCreated = DateLastRefreshed
+            WHERE IsMovie = 1
+            AND DateLastRefreshed IS NOT NULL
+            AND DateCreated <> DateLastRefreshed
+        """)
+        updated_count = cursor.rowcount
         conn.commit()
         print(f"\n✓ Updated {updated_count} movies")
     else:
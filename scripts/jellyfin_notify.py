@@ -6,38 +6,42 @@ Triggers immediate library scan when media is imported.
 
 import os
 import sys
-import urllib.error
-import urllib.request
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection details resolved once at import — Radarr can fire this script
+# for every file in a batch import, so keep per-call work minimal
+JELLYFIN_HOST = os.getenv("JELLYFIN_HOST", "jellyfin")
+JELLYFIN_PORT = int(os.getenv("JELLYFIN_PORT", "8096"))
+JELLYFIN_API_KEY = os.getenv("JELLYFIN_API_KEY", "")
+REFRESH_URL = f"http://{JELLYFIN_HOST}:{JELLYFIN_PORT}/Library/Refresh?api_key={JELLYFIN_API_KEY}"
+
+# Pooled session with retries: the socket is reused across rapid-fire
+# notifications and transient 502s back off instead of failing the hook
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])),
+)
 
 
 def notify_jellyfin():
     """Trigger Jellyfin library scan for the Movies library."""
-    # Get Jellyfin connection details from environment or defaults
-    host = os.getenv("JELLYFIN_HOST", "jellyfin")
-    port = int(os.getenv("JELLYFIN_PORT", "8096"))
-    api_key = os.getenv("JELLYFIN_API_KEY", "")
-
-    if not api_key:
+    if not JELLYFIN_API_KEY:
         print("ERROR: JELLYFIN_API_KEY not set", file=sys.stderr)
         return False
 
-    # Construct API URL for library refresh
-    url = f"http://{host}:{port}/Library/Refresh?api_key={api_key}"
-
     try:
-        # Send POST request to trigger library scan
-        req = urllib.request.Request(url, method="POST")
-        req.add_header("Content-Type", "application/json")
-
-        with urllib.request.urlopen(req, timeout=10) as response:
-            if response.status == 204 or response.status == 200:
-                print("Successfully triggered Jellyfin library scan")
-                return True
-            else:
-                print(f"Unexpected response: {response.status}", file=sys.stderr)
-                return False
+        response = _SESSION.post(REFRESH_URL, timeout=10)
+        if response.status_code in (200, 204):
+            print("Successfully triggered Jellyfin library scan")
+            return True
+        print(f"Unexpected response: {response.status_code}", file=sys.stderr)
+        return False
 
-    except urllib.error.URLError as e:
+    except requests.ConnectionError as e:
         print(f"Failed to connect to Jellyfin: {e}", file=sys.stderr)
         return False
     except Exception as e:
@@ -9,7 +9,7 @@ Actions:
   • If LOG_PRUNE_COMPRESS=true (default) compress oversize logs to log.<ts>.gz and truncate original
   • Otherwise simply truncate (copy tail marker)
 
-Binary dependencies: gzip (for compression). Falls back to truncate only if missing.
+Compression uses Python's gzip module directly — no external binary needed.
 
 Usage:
   python scripts/log_pruner.py                # prune using env defaults
@@ -24,11 +24,12 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import gzip
 import os
 import shutil
 import sys
 import time
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Attempt to load .env automatically so running via package.json (which does not
@@ -77,9 +78,32 @@ def gather_roots(args) -> list[Path]:
   return [r for r in roots if r.exists()]
 
 
-def should_process(path: Path, max_size: int, min_age_days: int, now: float) -> bool:
+def walk_logs(root: Path):
+  """Yield os.DirEntry objects for every *.log file under root.
+
+  scandir-based: the suffix test runs on the raw name and each entry carries
+  a cached stat, so should_process adds no extra syscall per file.
+  """
+  stack: list[str] = [str(root)]
+  while stack:
+    try:
+      it = os.scandir(stack.pop())
+    except OSError:
+      continue
+    with it:
+      for entry in it:
+        try:
+          if entry.is_dir(follow_symlinks=False):
+            stack.append(entry.path)
+          elif entry.name.endswith(".log"):
+            yield entry
+        except OSError:
+          continue
+
+
+def should_process(entry: os.DirEntry | Path, max_size: int, min_age_days: int, now: float) -> bool:
   try:
-    st = path.stat()
+    st = entry.stat()
   except FileNotFoundError:
     return False
   if st.st_size < max_size:
@@ -88,18 +112,14 @@ def should_process(path: Path, max_size: int, min_age_days: int, now: float) ->
   return age_days >= min_age_days
 
 
-def compress_and_truncate(path: Path, dry_run: bool) -> tuple[bool, str]:
-  ts = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+def compress_and_truncate(path: Path, dry_run: bool, ts: str) -> tuple[bool, str]:
   backup = path.with_suffix(path.suffix + f".{ts}.gz")
-  if shutil.which("gzip") is None:
-    return truncate(path, dry_run)
   try:
     if not dry_run:
-      # Copy then compress
-      import gzip
-
-      with path.open("rb") as src, gzip.open(backup, "wb", compresslevel=6) as dst:
-        shutil.copyfileobj(src, dst)
+      # Level 1: these archives are throwaway prune artifacts, so favour
+      # throughput over ratio; 1 MiB copy buffer beats the 16 KiB default.
+      with path.open("rb") as src, gzip.open(backup, "wb", compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
       # Truncate original
       with path.open("w", encoding="utf-8") as f:
         f.write(f"[pruned @ {ts} archived -> {backup.name}]\n")
@@ -108,8 +128,7 @@ def compress_and_truncate(path: Path, dry_run: bool) -> tuple[bool, str]:
     return False, f"compress failed: {e}"
 
 
-def truncate(path: Path, dry_run: bool) -> tuple[bool, str]:
-  ts = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+def truncate(path: Path, dry_run: bool, ts: str) -> tuple[bool, str]:
   try:
     if not dry_run:
       with path.open("w", encoding="utf-8") as f:
@@ -132,21 +151,45 @@ def main() -> int:
     return 2
   max_size_bytes = args.max_mb * 1024 * 1024
   now = time.time()
-  processed = 0
+  # One timestamp per run: cheaper than a datetime per file, and every
+  # archive from the same prune shares an identifiable suffix
+  ts = time.strftime("%Y%m%d-%H%M%S", time.gmtime(now))
+  candidates = [
+    Path(entry.path)
+    for root in roots
+    for entry in walk_logs(root)
+    if should_process(entry, max_size_bytes, args.min_age, now)
+  ]
+
+  results: list[tuple[Path, bool, str]] = []
+  if do_compress and not args.dry_run and len(candidates) > 1:
+    # Compression is CPU-bound and each file is independent — fan out
+    # across cores. Dry runs and plain truncation stay serial (no work).
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(candidates))) as pool:
+      futures = {pool.submit(compress_and_truncate, p, False, ts): p for p in candidates}
+      for fut in as_completed(futures):
+        path = futures[fut]
+        try:
+          ok, action = fut.result()
+        except Exception as e:  # noqa
+          ok, action = False, f"compress failed: {e}"
+        results.append((path, ok, action))
+    results.sort()
+  else:
+    for path in candidates:
+      if do_compress:
+        ok, action = compress_and_truncate(path, args.dry_run, ts)
+      else:
+        ok, action = truncate(path, args.dry_run, ts)
+      results.append((path, ok, action))
+
   failures = 0
-  for root in roots:
-    for path in root.rglob("*.log"):
-      if should_process(path, max_size_bytes, args.min_age, now):
-        if do_compress:
-          ok, action = compress_and_truncate(path, args.dry_run)
-        else:
-          ok, action = truncate(path, args.dry_run)
-        processed += 1
-        status = "✅" if ok else "❌"
-        print(f"{status} {path} -> {action}{' (dry-run)' if args.dry_run else ''}")
-        if not ok:
-          failures += 1
-  print(f"Summary: processed {processed} file(s); failures={failures}")
+  for path, ok, action in results:
+    status = "✅" if ok else "❌"
+    print(f"{status} {path} -> {action}{' (dry-run)' if args.dry_run else ''}")
+    if not ok:
+      failures += 1
+  print(f"Summary: processed {len(results)} file(s); failures={failures}")
   if failures:
     return 1
   return 0
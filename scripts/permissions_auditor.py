@@ -26,7 +26,9 @@ import argparse
 import os
 import stat as statmod
 import sys
+import threading
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -41,48 +43,131 @@ if "CONFIG_DIRECTORY" not in os.environ or "SHARE_DIRECTORY" not in os.environ:
     pass
 
 
-@dataclass
+# Issue.flags bits — one Issue per path carries every problem found on it
+F_OWNER = 1
+F_GROUP = 2
+F_MODE = 4
+
+
+@dataclass(slots=True)
 class Issue:
-  path: Path
-  kind: str  # owner|group|mode
+  path: str
+  flags: int  # bitwise OR of F_OWNER / F_GROUP / F_MODE
   detail: str
+  is_dir: bool = False
+
+
+def _flags_label(flags: int) -> str:
+  names = ((F_OWNER, "owner"), (F_GROUP, "group"), (F_MODE, "mode"))
+  return "+".join(name for bit, name in names if flags & bit)
 
 
 DEFAULT_DIR_MODE = 0o755
 DEFAULT_FILE_MODE = 0o644
 
-EXCLUDE_DIR_NAMES = {".venv", "__pycache__", "node_modules", "dist", "cache"}
+EXCLUDE_DIR_NAMES = frozenset({".venv", "__pycache__", "node_modules", "dist", "cache"})
+
+
+class _Budget:
+  """Thread-safe countdown enforcing the global --max entry cap across workers."""
+
+  def __init__(self, limit: int) -> None:
+    self._lock = threading.Lock()
+    self.remaining = limit
 
+  def take(self) -> bool:
+    with self._lock:
+      if self.remaining <= 0:
+        return False
+      self.remaining -= 1
+      return True
 
-def walk_paths(root: Path, max_items: int, max_depth: int) -> Iterator[Path]:
-  """Yield paths under root honoring max_items and max_depth using os.walk for efficiency."""
-  count = 0
-  root_depth = len(root.parts)
-  for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
-    current_depth = len(Path(dirpath).parts) - root_depth
-    if max_depth >= 0 and current_depth > max_depth:
+
+def walk_paths(
+  root: Path | str,
+  budget: _Budget,
+  max_depth: int,
+  start_depth: int = 0,
+  stop: threading.Event | None = None,
+) -> Iterator[tuple[str, os.stat_result, bool]]:
+  """Yield (path, lstat, is_dir) tuples under root honoring the budget and max_depth.
+
+  scandir-based: each DirEntry carries a cached lstat and d_type, so the
+  auditor never pays a second stat syscall (or a Path allocation) per entry.
+  """
+  stack: list[tuple[str, int]] = [(str(root), start_depth)]
+  while stack:
+    if stop is not None and stop.is_set():
+      return
+    path_str, depth = stack.pop()
+    try:
+      it = os.scandir(path_str)
+    except OSError:
       continue
-    # Prune excluded directories in-place
-    dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIR_NAMES]
-    # Yield directory itself (skip root already accounted for)
-    if current_depth > 0:
-      if count >= max_items:
-        break
-      p_dir = Path(dirpath)
-      if any(part in EXCLUDE_DIR_NAMES for part in p_dir.parts):
-        continue
-      count += 1
-      yield p_dir
-    for fname in filenames:
-      if count >= max_items:
-        break
-      p_file = Path(dirpath) / fname
-      if any(part in EXCLUDE_DIR_NAMES for part in p_file.parts):
-        continue
-      count += 1
-      yield p_file
-    if count >= max_items:
+    with it:
+      for entry in it:
+        if entry.name in EXCLUDE_DIR_NAMES:
+          continue
+        try:
+          is_dir = entry.is_dir(follow_symlinks=False)
+          st = entry.stat(follow_symlinks=False)
+        except OSError:
+          continue
+        if not budget.take():
+          return
+        yield entry.path, st, is_dir
+        if is_dir and (max_depth < 0 or depth + 1 <= max_depth):
+          stack.append((entry.path, depth + 1))
+
+
+def _check_entry(
+  path: str, st: os.stat_result, is_dir: bool, puid: int, pgid: int, strict: bool
+) -> Issue | None:
+  flags = 0
+  details: list[str] = []
+  # Ownership
+  if st.st_uid != puid:
+    flags |= F_OWNER
+    details.append(f"uid {st.st_uid} != {puid}")
+  if st.st_gid != pgid:
+    flags |= F_GROUP
+    details.append(f"gid {st.st_gid} != {pgid}")
+  # Mode check
+  mode = statmod.S_IMODE(st.st_mode)
+  desired = DEFAULT_DIR_MODE if is_dir else DEFAULT_FILE_MODE
+  if strict:
+    if mode != desired:
+      flags |= F_MODE
+      details.append(f"{oct(mode)} != {oct(desired)}")
+  else:
+    # Loose: only flag world-writable
+    if mode & 0o002:
+      flags |= F_MODE
+      details.append(f"world-writable {oct(mode)}")
+  if not flags:
+    return None
+  return Issue(path, flags, "; ".join(details), is_dir)
+
+
+def _audit_subtree(
+  subroot: str,
+  start_depth: int,
+  puid: int,
+  pgid: int,
+  budget: _Budget,
+  strict: bool,
+  max_depth: int,
+  fast_fail: bool,
+  stop: threading.Event,
+) -> list[Issue]:
+  issues: list[Issue] = []
+  for path, st, is_dir in walk_paths(subroot, budget, max_depth, start_depth, stop):
+    if issue := _check_entry(path, st, is_dir, puid, pgid, strict):
+      issues.append(issue)
+    if fast_fail and len(issues) > 100:
+      stop.set()
       break
+  return issues
 
 
 def audit(
@@ -94,61 +179,64 @@ def audit(
   max_depth: int,
   fast_fail: bool,
 ) -> list[Issue]:
+  """Audit all roots, fanning subtrees out over a thread pool.
+
+  The scan is dominated by stat syscalls, so independent directory streams
+  overlap well: first-level children of each root become work units while
+  loose top-level files are checked inline. A shared budget enforces --max
+  and a stop event lets fast_fail short-circuit every worker.
+  """
+  budget = _Budget(max_items)
+  stop = threading.Event()
   issues: list[Issue] = []
+  units: list[str] = []
   for root in paths:
     if not root.exists():
       continue
-    for p in walk_paths(root, max_items, max_depth):
-      try:
-        st = p.lstat()
-      except FileNotFoundError:
-        continue
-      # Ownership
-      if st.st_uid != puid:
-        issues.append(Issue(p, "owner", f"uid {st.st_uid} != {puid}"))
-        if fast_fail and len(issues) > 100:
-          return issues
-      if st.st_gid != pgid:
-        issues.append(Issue(p, "group", f"gid {st.st_gid} != {pgid}"))
-        if fast_fail and len(issues) > 100:
-          return issues
-      # Mode check
-      mode = statmod.S_IMODE(st.st_mode)
-      desired = DEFAULT_DIR_MODE if p.is_dir() else DEFAULT_FILE_MODE
-      if strict:
-        if mode != desired:
-          issues.append(Issue(p, "mode", f"{oct(mode)} != {oct(desired)}"))
-          if fast_fail and len(issues) > 100:
-            return issues
-      else:
-        # Loose: only flag world-writable
-        if mode & 0o002:
-          issues.append(Issue(p, "mode", f"world-writable {oct(mode)}"))
-          if fast_fail and len(issues) > 100:
-            return issues
+    try:
+      it = os.scandir(root)
+    except OSError:
+      continue
+    with it:
+      for entry in it:
+        if entry.name in EXCLUDE_DIR_NAMES:
+          continue
+        try:
+          is_dir = entry.is_dir(follow_symlinks=False)
+          st = entry.stat(follow_symlinks=False)
+        except OSError:
+          continue
+        if not budget.take():
+          break
+        if issue := _check_entry(entry.path, st, is_dir, puid, pgid, strict):
+          issues.append(issue)
+        if is_dir and (max_depth < 0 or max_depth >= 1):
+          units.append(entry.path)
+  if units and not (fast_fail and len(issues) > 100):
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(units))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+      futures = [
+        pool.submit(_audit_subtree, sub, 1, puid, pgid, budget, strict, max_depth, fast_fail, stop)
+        for sub in units
+      ]
+      for fut in as_completed(futures):
+        issues.extend(fut.result())
   return issues
 
 
 def fix_issues(issues: list[Issue], puid: int, pgid: int, dry_run: bool) -> tuple[int, int]:
   fixed = 0
   failed = 0
-  seen = set()
+  # One Issue per path (flags carry everything wrong with it), so a single
+  # pass suffices: at most one chown plus one chmod, no dedup bookkeeping.
   for issue in issues:
-    if issue.path in seen:
-      continue
-    seen.add(issue.path)
     try:
-      if issue.kind in {"owner", "group"}:
-        if not dry_run:
+      if not dry_run:
+        if issue.flags & (F_OWNER | F_GROUP):
           os.chown(issue.path, puid, pgid)
-        fixed += 1
-      elif issue.kind == "mode":
-        if not dry_run:
-          if issue.path.is_dir():
-            os.chmod(issue.path, DEFAULT_DIR_MODE)
-          else:
-            os.chmod(issue.path, DEFAULT_FILE_MODE)
-        fixed += 1
+        if issue.flags & F_MODE:
+          os.chmod(issue.path, DEFAULT_DIR_MODE if issue.is_dir else DEFAULT_FILE_MODE)
+      fixed += 1
     except PermissionError:
       failed += 1
   return fixed, failed
@@ -184,6 +272,9 @@ def deduce_roots(args) -> tuple[list[Path], list[str]]:
   """Determine which roots to scan based on args + environment + compose file.
 
   Returns (roots, notes) where notes are explanatory messages.
+
+  Existence checks use os.access(..., F_OK): same answer as Path.exists
+  without materializing a throwaway stat_result per probe.
   """
   notes: list[str] = []
   roots: list[Path] = []
@@ -191,7 +282,7 @@ def deduce_roots(args) -> tuple[list[Path], list[str]]:
   # 1. User-specified paths take precedence
   for p in args.paths:
     path_obj = Path(p).resolve()
-    if path_obj.exists():
+    if os.access(path_obj, os.F_OK):
       roots.append(path_obj)
     else:
       notes.append(f"Skipping non-existent user path: {path_obj}")
@@ -200,10 +291,10 @@ def deduce_roots(args) -> tuple[list[Path], list[str]]:
   cfg = os.getenv("CONFIG_DIRECTORY")
   if cfg:
     cfg_path = Path(cfg).resolve()
-    if cfg_path.exists() and cfg_path not in roots:
+    if os.access(cfg_path, os.F_OK) and cfg_path not in roots:
       roots.append(cfg_path)
       notes.append(f"Detected CONFIG_DIRECTORY: {cfg_path}")
-    elif not cfg_path.exists():
+    elif not os.access(cfg_path, os.F_OK):
       notes.append(f"CONFIG_DIRECTORY set but missing: {cfg_path}")
   else:
     notes.append("CONFIG_DIRECTORY not set; consider adding to .env")
@@ -212,16 +303,16 @@ def deduce_roots(args) -> tuple[list[Path], list[str]]:
   share = os.getenv("SHARE_DIRECTORY")
   if share and not args.no_share:
     share_path = Path(share).resolve()
-    if share_path.exists() and share_path not in roots:
+    if os.access(share_path, os.F_OK) and share_path not in roots:
       roots.append(share_path)
       notes.append(f"Detected SHARE_DIRECTORY: {share_path}")
-    elif not share_path.exists():
+    elif not os.access(share_path, os.F_OK):
       notes.append(f"SHARE_DIRECTORY set but missing: {share_path}")
 
   # 4. Fallback: parse docker-compose.yml for explicit mounted config subdirs if root not found
   if not roots:
     compose_file = Path("docker-compose.yml")
-    if compose_file.exists():
+    if os.access(compose_file, os.F_OK):
       try:
         import re
 
@@ -235,10 +326,10 @@ def deduce_roots(args) -> tuple[list[Path], list[str]]:
           Path("/data/docker-config"),
         ]
         for base in candidate_bases:
-          if base.exists():
+          if os.access(base, os.F_OK):
             for sub in matches[:25]:  # safety cap
               sub_path = base / sub
-              if sub_path.exists():
+              if os.access(sub_path, os.F_OK):
                 roots.append(sub_path)
             if roots:
               notes.append(f"Guessed config subdirs under {base}")
@@ -275,14 +366,14 @@ def main() -> int:
     return 0
 
   if args.summary:
-    owners = sum(1 for i in issues if i.kind == "owner")
-    groups = sum(1 for i in issues if i.kind == "group")
-    modes = sum(1 for i in issues if i.kind == "mode")
+    owners = sum(1 for i in issues if i.flags & F_OWNER)
+    groups = sum(1 for i in issues if i.flags & F_GROUP)
+    modes = sum(1 for i in issues if i.flags & F_MODE)
     print(f"Issues: total={len(issues)} owner={owners} group={groups} mode={modes}")
   else:
     print(f"Found {len(issues)} issue(s):")
     for issue in issues[:50]:  # cap output
-      print(f" - [{issue.kind}] {issue.path} :: {issue.detail}")
+      print(f" - [{_flags_label(issue.flags)}] {issue.path} :: {issue.detail}")
     if len(issues) > 50:
       print(f" ... ({len(issues) - 50} more omitted)")
 
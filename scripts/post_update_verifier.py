@@ -22,15 +22,38 @@ Environment:
 
 from __future__ import annotations
 
-import json
 import os
 import subprocess
 import sys
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
+# orjson parses docker inspect output (tens of KB per container) ~3-5x
+# faster and takes bytes directly; stdlib json accepts bytes too, so the
+# fallback needs no decode step either.
+try:  # pragma: no cover - optional speedup
+  import orjson as _json
+except ImportError:
+  import json as _json
+
+# Pooled keep-alive session when requests is available: successive probes
+# reuse TCP (and, for swag, TLS) connections instead of handshaking each time.
+# The verifier may run from cron outside the venv, so urllib stays as fallback.
+try:  # pragma: no cover - exercised implicitly by http_probe
+  from requests import Session
+  from requests.adapters import HTTPAdapter
+
+  _SESSION = Session()
+  _adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+  _SESSION.mount("http://", _adapter)
+  _SESSION.mount("https://", _adapter)
+  _SESSION.headers["Connection"] = "keep-alive"
+except ImportError:
+  _SESSION = None
+
 # Auto-load .env to pick up API keys if not already in environment.
 if not any(k in os.environ for k in ("API_KEY_PROWLARR", "API_KEY_SONARR", "API_KEY_RADARR", "API_KEY_LIDARR", "API_KEY_SLSKD")):
   try:  # pragma: no cover
@@ -60,7 +83,7 @@ API_KEY_ENV = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
   service: str
   container_state: str
@@ -80,12 +103,34 @@ class Result:
     return not (self.http_status is not None and not (200 <= self.http_status < 300))
 
 
-def docker_inspect(name: str, docker_bin: str) -> dict:
+def docker_inspect_many(names: list[str], docker_bin: str) -> dict[str, dict]:
+  """Inspect every container in a single docker call.
+
+  One fork/exec + one JSON parse instead of one per service. docker inspect
+  still prints a JSON array for the names it does find even when some are
+  missing (it just exits non-zero), so parse stdout regardless and let
+  absent containers resolve to {} at lookup time.
+  """
   try:
-    out = subprocess.check_output(
-      [docker_bin, "inspect", name], stderr=subprocess.DEVNULL, text=True
+    proc = subprocess.run(
+      [docker_bin, "inspect", *names],
+      stdout=subprocess.PIPE,
+      stderr=subprocess.DEVNULL,
+      check=False,
     )
-    data = json.loads(out)
+  except FileNotFoundError as err:
+    raise RuntimeError("docker binary not available; set DOCKER_BIN") from err
+  try:
+    data = _json.loads(proc.stdout) if proc.stdout.strip() else []
+  except ValueError:
+    data = []
+  return {d.get("Name", "").lstrip("/"): d for d in data}
+
+
+def docker_inspect(name: str, docker_bin: str) -> dict:
+  try:
+    out = subprocess.check_output([docker_bin, "inspect", name], stderr=subprocess.DEVNULL)
+    data = _json.loads(out)
     return data[0] if data else {}
   except subprocess.CalledProcessError:
     return {}
@@ -94,11 +139,41 @@ def docker_inspect(name: str, docker_bin: str) -> dict:
 
 
 def http_probe(url: str, headers: dict, timeout: float = 5.0):
+  start = time.perf_counter()
+  if _SESSION is not None:
+    with _SESSION.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+      resp.raw.read(512)  # content unused; small read for latency
+      return resp.status_code, (time.perf_counter() - start) * 1000
   req = urllib.request.Request(url, headers=headers)
-  start = time.time()
   with urllib.request.urlopen(req, timeout=timeout) as resp:
     resp.read(512)  # content unused; small read for latency
-    return resp.status, (time.time() - start) * 1000
+    return resp.status, (time.perf_counter() - start) * 1000
+
+
+def probe_one(name: str, port: int, path: str, https: bool, inspect: dict) -> Result:
+  state = inspect.get("State", {})
+  container_state = state.get("Status", "missing")
+  health = state.get("Health", {}).get("Status", "")
+  scheme = "https" if https else "http"
+  url = f"{scheme}://localhost:{port}{path}"
+  headers = {}
+  api_env = API_KEY_ENV.get(name)
+  if api_env and (api_key := os.getenv(api_env)):
+    headers["X-Api-Key"] = api_key
+  http_status: int | None = None
+  latency = None
+  error = None
+  if container_state == "running":
+    try:
+      http_status, latency = http_probe(url, headers)
+    except urllib.error.URLError as e:
+      error = f"HTTP error: {e.reason}" if hasattr(e, "reason") else str(e)
+    except Exception as e:  # noqa
+      error = f"HTTP probe failed: {e}"  # broad but safe
+  else:
+    error = "container not running"
+
+  return Result(name, container_state, health, http_status, latency, error)
 
 
 def main() -> int:
@@ -114,33 +189,15 @@ def main() -> int:
   if not services:
     services = DEFAULT_SERVICES
 
-  results: list[Result] = []
   fatal = False
-  for name, port, path, https in services:
-    inspect = docker_inspect(name, docker_bin)
-    state = inspect.get("State", {})
-    container_state = state.get("Status", "missing")
-    health = state.get("Health", {}).get("Status", "")
-    scheme = "https" if https else "http"
-    url = f"{scheme}://localhost:{port}{path}"
-    headers = {}
-    api_env = API_KEY_ENV.get(name)
-    if api_env and (api_key := os.getenv(api_env)):
-      headers["X-Api-Key"] = api_key
-    http_status: int | None = None
-    latency = None
-    error = None
-    if container_state == "running":
-      try:
-        http_status, latency = http_probe(url, headers)
-      except urllib.error.URLError as e:
-        error = f"HTTP error: {e.reason}" if hasattr(e, "reason") else str(e)
-      except Exception as e:  # noqa
-        error = f"HTTP probe failed: {e}"  # broad but safe
-    else:
-      error = "container not running"
-
-    results.append(Result(name, container_state, health, http_status, latency, error))
+  inspections = docker_inspect_many([s[0] for s in services], docker_bin)
+  # Probes are pure I/O (one HTTP round-trip each), so run them concurrently:
+  # wall time collapses from the sum of latencies to roughly the slowest
+  # single probe. pool.map preserves service order.
+  with ThreadPoolExecutor(max_workers=len(services)) as pool:
+    results: list[Result] = list(
+      pool.map(lambda tpl: probe_one(*tpl, inspect=inspections.get(tpl[0], {})), services)
+    )
 
   any_ok = any(r.ok for r in results)
   if not any_ok:
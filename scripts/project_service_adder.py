@@ -34,7 +34,10 @@ Design Notes:
 from __future__ import annotations
 
 import argparse
+import bisect
 import contextlib
+import functools
+import mmap
 import os
 import random
 import re
@@ -48,7 +51,7 @@ COMPOSE_FILE = Path("docker-compose.yml")
 DEFAULT_NETWORK = "nas-network"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectCandidate:
     name: str
     path: Path
@@ -56,6 +59,7 @@ class ProjectCandidate:
     exposed: list[str]  # raw container ports (may include protocol suffix like 8080/tcp)
 
 
+@functools.lru_cache(maxsize=1)
 def expand_projects_root() -> Path:
     root = os.getenv("PROJECTS_DIRECTORY") or "~/projects"
     return Path(os.path.expanduser(root)).resolve()
@@ -63,56 +67,100 @@ def expand_projects_root() -> Path:
 
 def find_projects(root: Path) -> list[ProjectCandidate]:
     candidates: list[ProjectCandidate] = []
-    if not root.exists():
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
         return candidates
-    for child in sorted(root.iterdir()):
-        if not child.is_dir():
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        dockerfile = os.path.join(entry.path, "Dockerfile")
+        # Open directly instead of probing with is_file() first — one stat
+        # less per project, and the dir check above rode on cached d_type
+        try:
+            with open(dockerfile, "rb") as f:
+                text = f.read(DOCKERFILE_READ_CAP).decode("utf-8", "ignore")
+        except OSError:
             continue
-        dockerfile = child / "Dockerfile"
-        if dockerfile.is_file():
-            exposed = parse_expose_ports(dockerfile.read_text(encoding="utf-8", errors="ignore"))
-            candidates.append(ProjectCandidate(name=child.name, path=child, dockerfile=dockerfile, exposed=exposed))
+        candidates.append(
+            ProjectCandidate(
+                name=entry.name,
+                path=Path(entry.path),
+                dockerfile=Path(dockerfile),
+                exposed=parse_expose_ports(text),
+            )
+        )
     return candidates
 
 
 EXPOSE_RE = re.compile(r"^\s*EXPOSE\s+(.+)$", re.IGNORECASE | re.MULTILINE)
+# Real Dockerfiles put EXPOSE within the first few KiB; bound the read and the
+# token count so generated/pathological files cost a small constant
+DOCKERFILE_READ_CAP = 65536
+MAX_EXPOSE_PORTS = 16
+# One alternation, bytes-compiled so it can scan an mmap'd compose file:
+# branch 1 matches port lines like '- 8080:8080' or ' - "8080:80"',
+# branch 2 matches service definition lines (two+ spaces indent, name, colon)
+COMPOSE_INDEX_RE = re.compile(
+    rb"^[ \t-]+['\"]?(\d+):(\d+)|^[ \t]{2,}([\w.-]+):[ \t\r]*$",
+    re.MULTILINE,
+)
 
 
 def parse_expose_ports(dockerfile_text: str) -> list[str]:
-    ports: list[str] = [
-        token
-        for match in EXPOSE_RE.finditer(dockerfile_text)
-        for token in (t.strip() for t in match.group(1).strip().split())
-        if token and re.match(r"^\d+(/(tcp|udp))?$", token)
-    ]
+    ports: list[str] = []
+    for match in EXPOSE_RE.finditer(dockerfile_text):
+        for token in match.group(1).split():
+            # Plain split + isdigit beats a per-token regex for 'NNNN[/proto]'
+            parts = token.split("/", 1)
+            if not parts[0].isdigit():
+                continue
+            if len(parts) == 2 and parts[1] not in ("tcp", "udp"):
+                continue
+            ports.append(token)
+            if len(ports) >= MAX_EXPOSE_PORTS:
+                return ports
     return ports
 
 
-def parse_existing_host_ports(compose_text: str) -> set[int]:
-    host_ports: set[int] = set()
-    # Match lines like '- 8080:8080' or ' - "8080:80"'
-    port_line_re = re.compile(r"^[ \t-]+['\"]?(\d+):(\d+)" , re.MULTILINE)
-    for m in port_line_re.finditer(compose_text):
-        with contextlib.suppress(ValueError):
-            host_ports.add(int(m.group(1)))
-    return host_ports
+@dataclass
+class ComposeIndex:
+    used_ports: set[int]
+    service_names: set[str]
+
 
+def index_compose(buf: mmap.mmap | bytes) -> ComposeIndex:
+    """Collect claimed host ports and defined service names in one linear pass.
 
-def service_name_exists(compose_text: str, name: str) -> bool:
-    # Naive but sufficient: line starting at two spaces then name+':'
-    pattern = re.compile(rf"^\s{{2,}}{re.escape(name)}:\s*$", re.MULTILINE)
-    return bool(pattern.search(compose_text))
+    Operates on a bytes-like buffer (mmap included), so the compose file is
+    scanned straight out of the page cache without a heap copy.
+    """
+    used_ports: set[int] = set()
+    service_names: set[str] = set()
+    for m in COMPOSE_INDEX_RE.finditer(buf):
+        if port := m.group(1):
+            with contextlib.suppress(ValueError):
+                used_ports.add(int(port))
+        else:
+            service_names.add(m.group(3).decode("utf-8", "ignore"))
+    return ComposeIndex(used_ports=used_ports, service_names=service_names)
 
 
-def propose_port(container_port: int, used: set[int]) -> int:
+def propose_port(container_port: int, used: set[int], used_sorted: list[int]) -> int:
     if container_port not in used and container_port >= 1024:
         return container_port
-    # If privileged (<1024) or taken, search upward
+    # If privileged (<1024) or taken, search upward: bisect into the sorted
+    # port list and walk past the contiguous run of taken ports (O(log n)
+    # to land, then one step per collision instead of a set probe each).
     p = max(container_port, 1024)
-    while p in used:
+    i = bisect.bisect_left(used_sorted, p)
+    while i < len(used_sorted) and used_sorted[i] == p:
         p += 1
+        i += 1
         if p > 65000:  # improbable
             p = random.randint(20000, 40000)
+            i = bisect.bisect_left(used_sorted, p)
     return p
 
 
@@ -123,9 +171,6 @@ def build_service_block(
     subdomain: str | None,
     add_basic_env: bool,
 ) -> str:
-    lines: list[str] = []
-    lines.append(f"  {name}:")
-    lines.append("    build:")
     # Represent build context via PROJECTS_DIRECTORY env var if project lives under it
     proj_root = expand_projects_root()
     try:
@@ -134,40 +179,63 @@ def build_service_block(
     except ValueError:
         # Not under the root; fall back to absolute (user can adjust manually)
         context_expr = str(project_path)
-    lines.append(f"      context: {context_expr}")
-    lines.append("      dockerfile: Dockerfile")
-    lines.append(f"    container_name: {name}")
-    if add_basic_env:
-        lines.append("    environment:")
-        lines.append("      - PUID=${PUID:-1000}")
-        lines.append("      - PGID=${PGID:-1000}")
-        lines.append("      - TZ=${TZ:-UTC}")
+
+    env_block = (
+        "    environment:\n"
+        "      - PUID=${PUID:-1000}\n"
+        "      - PGID=${PGID:-1000}\n"
+        "      - TZ=${TZ:-UTC}"
+        if add_basic_env
+        else ""
+    )
+
+    ports_block = ""
     if port_map:
-        lines.append("    ports:")
-        for host_port, container_spec in port_map:
-            lines.append(f"      - {host_port}:{container_spec}")
-    lines.append("    restart: unless-stopped")
-    lines.append("    networks:")
-    lines.append(f"      - {DEFAULT_NETWORK}")
-    lines.append("    labels:")
-    lines.append("      - swag=enable")
-    lines.append("      - com.centurylinklabs.watchtower.enable=true")
+        ports_block = "    ports:\n" + "\n".join(
+            f"      - {host_port}:{container_spec}" for host_port, container_spec in port_map
+        )
+
     # Healthcheck: use first TCP port if any
     first_tcp = next((c for _, c in port_map if not c.endswith("/udp")), None)
+    health_block = ""
     if first_tcp:
         port_only = first_tcp.split("/")[0]
-        lines.append("    healthcheck:")
-        lines.append(f"      test: [CMD, curl, -f, 'http://localhost:{port_only}/']")
-        lines.append("      interval: 45s")
-        lines.append("      timeout: 6s")
-        lines.append("      retries: 3")
-        lines.append("      start_period: 30s")
+        health_block = (
+            "    healthcheck:\n"
+            f"      test: [CMD, curl, -f, 'http://localhost:{port_only}/']\n"
+            "      interval: 45s\n"
+            "      timeout: 6s\n"
+            "      retries: 3\n"
+            "      start_period: 30s"
+        )
+
     # Comment for proxy URL
     domain = os.getenv("PUBLIC_DOMAIN")
-    if domain:
-        sd = subdomain or name
-        lines.append(f"    # Expected URL: https://{sd}.{domain}")
-    return "\n".join(lines)
+    url_comment = f"    # Expected URL: https://{subdomain or name}.{domain}" if domain else ""
+
+    # Static lines stay literal; conditional fragments drop out via filter(None)
+    return "\n".join(
+        filter(
+            None,
+            [
+                f"  {name}:",
+                "    build:",
+                f"      context: {context_expr}",
+                "      dockerfile: Dockerfile",
+                f"    container_name: {name}",
+                env_block,
+                ports_block,
+                "    restart: unless-stopped",
+                "    networks:",
+                f"      - {DEFAULT_NETWORK}",
+                "    labels:",
+                "      - swag=enable",
+                "      - com.centurylinklabs.watchtower.enable=true",
+                health_block,
+                url_comment,
+            ],
+        )
+    )
 
 
 def interactive_select(candidates: list[ProjectCandidate]) -> ProjectCandidate | None:
@@ -190,23 +258,29 @@ def interactive_select(candidates: list[ProjectCandidate]) -> ProjectCandidate |
         print("Invalid selection. Try again.")
 
 
-def ensure_compose_exists() -> str:
+def ensure_compose_exists() -> mmap.mmap | bytes:
     if not COMPOSE_FILE.is_file():
         print("❌ docker-compose.yml not found in current directory.")
         sys.exit(2)
-    return COMPOSE_FILE.read_text(encoding="utf-8")
+    with COMPOSE_FILE.open("rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            return b""
 
 
-def append_service_block(compose_text: str, service_block: str, name: str) -> None:
+def append_service_block(compose_text: mmap.mmap | bytes, service_block: str, name: str) -> None:
     # Use timezone-aware UTC datetime (avoid deprecated utcnow())
     ts = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
     marker = f"\n# --- added by project_service_adder {ts} ({name}) ---\n"
-    if not compose_text.endswith("\n"):
+    if compose_text[-1:] != b"\n":
         marker = "\n" + marker
+    # Release the read-only mapping before reopening the file for append
+    if isinstance(compose_text, mmap.mmap):
+        compose_text.close()
     with COMPOSE_FILE.open("a", encoding="utf-8") as f:
-        f.write(marker)
-        f.write(service_block)
-        f.write("\n")
+        # Single write: one buffered flush/syscall instead of three
+        f.write(marker + service_block + "\n")
 
 
 def choose_subdomain(default: str) -> str | None:
@@ -224,7 +298,8 @@ def main(argv: Iterable[str] | None = None) -> int:
     args = parser.parse_args(list(argv) if argv is not None else None)
 
     compose_text = ensure_compose_exists()
-    used_ports = parse_existing_host_ports(compose_text)
+    idx = index_compose(compose_text)
+    used_ports = idx.used_ports
 
     root = expand_projects_root()
     candidates = find_projects(root)
@@ -247,19 +322,21 @@ def main(argv: Iterable[str] | None = None) -> int:
             return 0
 
     name = selected.name
-    if service_name_exists(compose_text, name):
+    if name in idx.service_names:
         print(f"❌ A service named '{name}' already exists in docker-compose.yml")
         return 1
 
     # Determine port mappings
+    used_sorted = sorted(used_ports)
     port_map: list[tuple[int, str]] = []
     for raw in selected.exposed:
         # raw like '8080' or '8080/udp'
         parts = raw.split("/")
         cport = int(parts[0])
         proto_suffix = "" if len(parts) == 1 or parts[1] == "tcp" else "/udp"
-        host_port = propose_port(cport, used_ports)
+        host_port = propose_port(cport, used_ports, used_sorted)
         used_ports.add(host_port)
+        bisect.insort(used_sorted, host_port)
         port_map.append((host_port, f"{cport}{proto_suffix}"))
 
     # Optional subdomain input if not provided
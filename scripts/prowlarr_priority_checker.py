@@ -7,19 +7,30 @@ Example usage:
 """
 
 import os
+import re
 import sys
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 try:
   from dotenv import load_dotenv  # type: ignore
-except Exception:  # pragma: no cover
+except ImportError:  # pragma: no cover
 
   def load_dotenv():  # fallback noop
     return False
 
 
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+# rapidfuzz scores the whole choices list in one C call — typically an order
+# of magnitude faster than difflib's pure-Python ratio on these short names.
+# The difflib path below remains as fallback when it isn't installed.
+try:  # pragma: no cover - optional speedup
+  from rapidfuzz import fuzz, process
+except ImportError:
+  process = None
 
 from prowlarr_config import load_prowlarr_config
 
@@ -31,14 +42,70 @@ config = load_prowlarr_config()
 INDEXER_PRIORITIES = config.indexer_priorities
 FUZZY_MATCH_THRESHOLD = config.fuzzy_match_threshold
 
+# Pooled keep-alive session, mirroring the setter's ProwlarrApiClient: reuses
+# the TCP connection across requests and retries transient 5xx responses
+# (Prowlarr's "database is locked" surfaces as a 500) at the transport layer.
+session = requests.Session()
+_adapter = HTTPAdapter(
+  pool_connections=4,
+  pool_maxsize=4,
+  max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[500, 502, 503]),
+)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+
+# Indexer names differ between Prowlarr and the config mostly in separators
+# and brackets ("Solid-Torrents" vs "Solid Torrents"); stripping those gives a
+# canonical form that turns nearly every realistic variation into a dict hit.
+_NORM_RE = re.compile(r"[\s\-_.\[\]()]+")
+
+
+def _norm(name: str) -> str:
+  return _NORM_RE.sub("", name.lower())
+
+
+@lru_cache(maxsize=4)
+def _matchers_for(choices: tuple[str, ...]) -> list[tuple[str, int, SequenceMatcher]]:
+  """Build one SequenceMatcher per choice, bound as seq2, with its length.
+
+  difflib caches the b-side index across set_seq1 calls, so rebuilding it per
+  (query, choice) pair — the hot spot when every indexer is scored against
+  every configured name — collapses to one build per choice per run. The
+  length rides along so the caller can prune on the closed-form
+  real_quick_ratio bound without touching the matcher at all.
+  """
+  return [(c, len(c), SequenceMatcher(None, "", c.lower(), autojunk=False)) for c in choices]
+
 
 def find_best_match(query, choices, threshold=0.8):
   """Find the best fuzzy match for a query in a list of choices."""
+  if process is not None:
+    match = process.extractOne(
+      query, choices, scorer=fuzz.ratio, score_cutoff=threshold * 100, processor=str.lower
+    )
+    if match is None:
+      return None, 0
+    return match[0], match[1] / 100
+
   best_match = None
   best_ratio = 0
 
-  for choice in choices:
-    ratio = SequenceMatcher(None, query.lower(), choice.lower()).ratio()
+  query_lower = query.lower()
+  query_len = len(query_lower)
+  for choice, choice_len, matcher in _matchers_for(tuple(choices)):
+    # Cheap upper bounds first. real_quick_ratio is just
+    # 2*min(la,lb)/(la+lb), so compute it from the stored lengths and skip
+    # length-mismatched candidates without any set_seq1 work; quick_ratio
+    # (character multisets) then gates the full O(n*m) ratio().
+    bound = 2.0 * min(choice_len, query_len) / (choice_len + query_len)
+    if bound < threshold or bound <= best_ratio:
+      continue
+    matcher.set_seq1(query_lower)
+    bound = matcher.quick_ratio()
+    if bound < threshold or bound <= best_ratio:
+      continue
+    ratio = matcher.ratio()
     if ratio > best_ratio and ratio >= threshold:
       best_ratio = ratio
       best_match = choice
@@ -47,13 +114,14 @@ def find_best_match(query, choices, threshold=0.8):
 
 
 def main():
-  api_key = os.getenv("API_KEY_PROWLARR")
+  env = os.environ  # bind once; os.getenv is just a wrapper around this .get
+  api_key = env.get("API_KEY_PROWLARR")
   if not api_key:
     print("❌ Error: API_KEY_PROWLARR not found in .env file")
     sys.exit(1)
 
-  host = os.getenv("PROWLARR_HOST", "http://localhost")
-  port = int(os.getenv("PROWLARR_PORT", "9696"))
+  host = env.get("PROWLARR_HOST", "http://localhost")
+  port = int(env.get("PROWLARR_PORT", "9696"))
 
   print("🔧 Prowlarr Configuration:")
   print(f"   Host: {host}")
@@ -65,7 +133,8 @@ def main():
   # Get indexers
   try:
     url = f"{host}:{port}/api/v1/indexer"
-    response = requests.get(url, headers={"X-Api-Key": api_key}, timeout=10)
+    session.headers.update({"X-Api-Key": api_key})
+    response = session.get(url, timeout=10)
 
     if response.status_code != 200:
       print(f"❌ Failed to connect to Prowlarr API: {response.status_code}")
@@ -84,14 +153,24 @@ def main():
   not_in_list = []
 
   available_priority_names = list(INDEXER_PRIORITIES.keys())
+  priority_by_lower = {name.lower(): name for name in available_priority_names}
+  priority_by_norm = {_norm(name): name for name in available_priority_names}
 
   for indexer in indexers:
     name = indexer["name"]
     current_priority = indexer.get("priority", "N/A")
     indexer_id = indexer["id"]
 
-    # Try to find a match
-    matched_name, match_ratio = find_best_match(name, available_priority_names)
+    # Exact/case-insensitive hits resolve with one dict lookup; ratio 1.0 is
+    # what SequenceMatcher reports for two equal lowered strings anyway.
+    # Separator/bracket-only differences hit the normalized dict next, so the
+    # fuzzy pass only ever sees genuinely novel names.
+    matched_name = priority_by_lower.get(name.lower())
+    match_ratio = 1.0
+    if matched_name is None and (matched_name := priority_by_norm.get(_norm(name))):
+      match_ratio = 0.95
+    if matched_name is None:
+      matched_name, match_ratio = find_best_match(name, available_priority_names)
 
     if matched_name:
       new_priority = INDEXER_PRIORITIES[matched_name]
@@ -20,19 +20,33 @@ Usage:
 Author: GitHub Copilot
 """
 
+import hashlib
+import json
+import logging
 import os
+import re
 import sys
-import time
-from collections import defaultdict
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# rapidfuzz scores the whole candidate list in one C call; the difflib loop
+# in IndexerMatcher stays as fallback when it isn't installed
+try:  # pragma: no cover - optional speedup
+  from rapidfuzz import fuzz, process
+except ImportError:
+  process = None
 
 try:
   from dotenv import load_dotenv  # type: ignore
-except Exception:  # pragma: no cover
+except ImportError:  # pragma: no cover
 
   def load_dotenv():
     return False
@@ -40,6 +54,14 @@ except Exception:  # pragma: no cover
 
 from prowlarr_config import load_prowlarr_config
 
+# Indexer names differ between Prowlarr and the config mostly in separators
+# and brackets; the canonical form turns those variations into dict hits
+_NORM_RE = re.compile(r"[\s\-_.\[\]()]+")
+
+
+def _norm(name: str) -> str:
+  return _NORM_RE.sub("", name.lower())
+
 # Load environment variables from .env file (best-effort)
 load_dotenv()
 
@@ -47,6 +69,12 @@ load_dotenv()
 CONFIG = load_prowlarr_config()
 INDEXER_PRIORITIES: dict[str, int] = CONFIG.indexer_priorities
 
+# Per-request API tracing (status codes, headers, body slices) goes through
+# logger.debug with lazy %s formatting, so the reprs are never built unless
+# PROWLARR_LOG=DEBUG is set. User-facing progress/summary output stays print.
+logging.basicConfig(level=os.getenv("PROWLARR_LOG", "WARNING").upper(), format="%(message)s")
+logger = logging.getLogger("prowlarr")
+
 # Constants
 MIN_PRIORITY = 1
 MAX_PRIORITY = 50
@@ -56,6 +84,15 @@ FUZZY_MATCH_THRESHOLD = CONFIG.strict_fuzzy_threshold  # Use strict threshold fo
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAY_SECONDS = 2
 REQUEST_TIMEOUT_SECONDS = 10
+MAX_PARALLEL_UPDATES = 4  # matches the session adapter's pool_maxsize
+
+# Discovered API endpoints memoized per host:port so repeat runs skip probing
+ENDPOINT_CACHE_FILE = Path.home() / ".cache" / "prowlarr-priority" / "endpoint.json"
+
+# Fuzzy results memoized across runs, keyed by a hash of the candidate list
+# and threshold so the cache self-invalidates when the config changes
+MATCH_CACHE_FILE = Path.home() / ".cache" / "prowlarr-priority" / "match-cache.json"
+MATCH_CACHE_MAX_ENTRIES = 100
 
 
 @dataclass
@@ -105,17 +142,30 @@ class UpdateResult:
   error_type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingSummary:
-  """Summary of all processing results."""
-
-  results: dict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
+  """Summary of all processing results.
+
+  Categories are typed list fields rather than a string-keyed dict: appends
+  and reads become slot lookups, and a mistyped category is an AttributeError
+  instead of a silently empty bucket.
+  """
+
+  success: list[str] = field(default_factory=list)
+  skipped: list[str] = field(default_factory=list)
+  skipped_unchanged: list[str] = field(default_factory=list)
+  skipped_invalid: list[str] = field(default_factory=list)
+  database_locked: list[str] = field(default_factory=list)
+  indexer_issues: list[str] = field(default_factory=list)
+  script_errors: list[str] = field(default_factory=list)
+  other_error: list[str] = field(default_factory=list)
+  exception: list[str] = field(default_factory=list)
   total_attempted: int = 0
   successful_updates: int = 0
 
   def add_result(self, category: str, item: str) -> None:
     """Add a result to the specified category."""
-    self.results[category].append(item)
+    getattr(self, category).append(item)
 
   def increment_attempted(self) -> None:
     """Increment the total attempted counter."""
@@ -134,31 +184,102 @@ class ProcessingSummary:
 
 
 class IndexerMatcher:
-  """Handles fuzzy matching of indexer names."""
-
-  @staticmethod
-  def find_best_match(
-    target_name: str, available_names: list[str], threshold: float = FUZZY_MATCH_THRESHOLD
-  ) -> IndexerMatchResult:
+  """Handles fuzzy matching of indexer names against a fixed candidate list."""
+
+  def __init__(self, available_names: list[str], threshold: float = FUZZY_MATCH_THRESHOLD):
+    self.available_names = available_names
+    self.threshold = threshold
+    # Exact and case-insensitive lookups are structurally O(1) — resolve them
+    # through these instead of scanning the candidate list per indexer
+    self._names = set(available_names)
+    self._by_lower = {name.lower(): name for name in available_names}
+    self._by_norm = {_norm(name): name for name in available_names}
+    # One matcher per candidate, candidate bound as seq2: difflib caches the
+    # b-side index across set_seq1 calls, so each candidate's index is built
+    # once per run instead of once per (indexer, candidate) pair. The length
+    # rides along for the closed-form real_quick_ratio prune.
+    self._matchers = [
+      (name, len(name), SequenceMatcher(None, "", name.lower(), autojunk=False))
+      for name in available_names
+    ]
+    # Fuzzy results persist across runs; indexer names rarely change, so the
+    # second and later runs skip the fuzzy tail entirely on a hit
+    self._cache_key = hashlib.blake2b(
+      json.dumps([sorted(available_names), threshold]).encode(), digest_size=8
+    ).hexdigest()
+    self._match_cache = self._load_match_cache()
+
+  def _load_match_cache(self) -> OrderedDict:
+    try:
+      with open(MATCH_CACHE_FILE, encoding="utf-8") as file:
+        return OrderedDict(json.load(file).get(self._cache_key, {}))
+    except (OSError, ValueError):
+      return OrderedDict()
+
+  def _store_match(self, target_name: str, matched_name: str | None, confidence: float) -> None:
+    """Record one fuzzy result and persist the (bounded) cache best-effort."""
+    self._match_cache[target_name] = [matched_name, confidence]
+    self._match_cache.move_to_end(target_name)
+    while len(self._match_cache) > MATCH_CACHE_MAX_ENTRIES:
+      self._match_cache.popitem(last=False)
+    try:
+      MATCH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+      fd, tmp = tempfile.mkstemp(dir=MATCH_CACHE_FILE.parent, suffix=".tmp")
+      with os.fdopen(fd, "w", encoding="utf-8") as file:
+        # Only the current config's bucket is kept; stale hashes drop out
+        json.dump({self._cache_key: dict(self._match_cache)}, file)
+      os.replace(tmp, MATCH_CACHE_FILE)
+    except OSError:
+      pass
+
+  def find_best_match(self, target_name: str) -> IndexerMatchResult:
     """Find the best matching indexer name using fuzzy matching."""
     best_match = None
     best_ratio = 0.0
 
-    for name in available_names:
-      # Try exact match first
-      if target_name == name:
-        return IndexerMatchResult(matched_name=name, confidence=1.0)
-
-      # Try case-insensitive match
-      if target_name.lower() == name.lower():
-        return IndexerMatchResult(matched_name=name, confidence=0.95)
-
-      # Try fuzzy matching
-      ratio = SequenceMatcher(None, target_name.lower(), name.lower()).ratio()
-      if ratio > best_ratio and ratio >= threshold:
+    target_lower = target_name.lower()
+    # Exact match first, then case-insensitive — both single dict/set hits
+    if target_name in self._names:
+      return IndexerMatchResult(matched_name=target_name, confidence=1.0)
+    hit = self._by_lower.get(target_lower) or self._by_norm.get(_norm(target_name))
+    if hit is not None:
+      return IndexerMatchResult(matched_name=hit, confidence=0.95)
+
+    if (cached := self._match_cache.get(target_name)) is not None:
+      self._match_cache.move_to_end(target_name)
+      return IndexerMatchResult(matched_name=cached[0], confidence=cached[1])
+
+    if process is not None:
+      match = process.extractOne(
+        target_name,
+        self.available_names,
+        scorer=fuzz.ratio,
+        score_cutoff=self.threshold * 100,
+        processor=str.lower,
+      )
+      if match is not None:
+        best_match, best_ratio = match[0], match[1] / 100
+      self._store_match(target_name, best_match, best_ratio)
+      return IndexerMatchResult(matched_name=best_match, confidence=best_ratio)
+
+    target_len = len(target_lower)
+    for name, name_len, matcher in self._matchers:
+      # Fuzzy matching — gate the full ratio() behind cheap upper bounds.
+      # real_quick_ratio is just 2*min(la,lb)/(la+lb), so length-mismatched
+      # candidates are pruned from the stored lengths before any matcher work
+      bound = 2.0 * min(name_len, target_len) / (name_len + target_len)
+      if bound < self.threshold or bound <= best_ratio:
+        continue
+      matcher.set_seq1(target_lower)
+      bound = matcher.quick_ratio()
+      if bound < self.threshold or bound <= best_ratio:
+        continue
+      ratio = matcher.ratio()
+      if ratio > best_ratio and ratio >= self.threshold:
         best_ratio = ratio
         best_match = name
 
+    self._store_match(target_name, best_match, best_ratio)
     return IndexerMatchResult(matched_name=best_match, confidence=best_ratio)
 
 
@@ -233,10 +354,71 @@ class ProwlarrApiClient:
     self.config = config
     self.session = requests.Session()
     self.session.headers.update({"X-Api-Key": config.api_key})
+    # Keep-alive pooling plus urllib3-level retries: 500s (Prowlarr's
+    # "database is locked") back off and retry inside the transport, so
+    # update_indexer no longer needs its own attempt/sleep loop.
+    # raise_on_status=False hands the final 500 back for classification.
+    adapter = HTTPAdapter(
+      pool_connections=1,
+      pool_maxsize=4,
+      max_retries=Retry(
+        total=MAX_RETRY_ATTEMPTS,
+        backoff_factor=RETRY_DELAY_SECONDS / 2,
+        status_forcelist=[500],
+        allowed_methods=["PUT", "GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+      ),
+    )
+    self.session.mount("http://", adapter)
+    self.session.mount("https://", adapter)
+    self.session.headers["Connection"] = "keep-alive"
+    # Set by fetch_indexers once an endpoint answers; updates reuse it
+    # instead of re-probing endpoint variants per indexer
+    self._indexer_endpoint: str | None = None
+
+  @property
+  def _endpoint_cache_key(self) -> str:
+    return f"{self.config.host}:{self.config.port}"
+
+  def _load_cached_endpoint(self) -> str | None:
+    """Return the memoized base URL for this host:port, if any."""
+    try:
+      with open(ENDPOINT_CACHE_FILE, encoding="utf-8") as file:
+        return json.load(file).get(self._endpoint_cache_key)
+    except (OSError, ValueError):
+      return None
+
+  def _store_cached_endpoint(self, base_url: str) -> None:
+    """Best-effort atomic update of the endpoint cache; never fails discovery."""
+    try:
+      ENDPOINT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+      try:
+        with open(ENDPOINT_CACHE_FILE, encoding="utf-8") as file:
+          cached = json.load(file)
+      except (OSError, ValueError):
+        cached = {}
+      cached[self._endpoint_cache_key] = base_url
+      fd, tmp = tempfile.mkstemp(dir=ENDPOINT_CACHE_FILE.parent, suffix=".tmp")
+      with os.fdopen(fd, "w", encoding="utf-8") as file:
+        json.dump(cached, file)
+      os.replace(tmp, ENDPOINT_CACHE_FILE)
+    except OSError:
+      pass
 
   def _discover_api_endpoint(self) -> str:
     """Discover the working API endpoint."""
-    print("Testing different Prowlarr API endpoints...")
+    # Fast path: an endpoint discovered on a previous run, re-verified with a
+    # single GET so a stale cache entry falls through to the full probe.
+    if cached := self._load_cached_endpoint():
+      try:
+        response = self.session.get(f"{cached}/indexer", timeout=5)
+        if response.status_code == 200 and "json" in response.headers.get("content-type", ""):
+          return cached
+      except requests.RequestException:
+        pass
+
+    logger.debug("Testing different Prowlarr API endpoints...")
 
     api_paths = [
       f"{self.config.base_url}/v1/indexer",
@@ -246,24 +428,37 @@ class ProwlarrApiClient:
       f"{self.config.base_url}/v1/system/status",
     ]
 
-    for test_url in api_paths:
-      print(f"Testing: {test_url}")
+    def probe(test_url: str) -> tuple[str, Any]:
       try:
-        response = self.session.get(test_url, timeout=5)
-        content_type = response.headers.get("content-type", "unknown")
-        print(f"  Status: {response.status_code}, Content-Type: {content_type}")
-
-        if response.status_code == 200 and "json" in content_type:
-          print("  SUCCESS: Found working API endpoint!")
-          if "indexer" in test_url:
-            return test_url.rsplit("/", 1)[0]  # Remove the last part to get base URL
-          elif "status" in test_url:
-            print(f"  System status response: {response.json()}")
-        else:
-          print(f"  Failed: {response.text[:100]}")
+        return test_url, self.session.get(test_url, timeout=5)
       except Exception as e:
-        print(f"  Error: {e}")
-      print()
+        logger.debug("  Error probing %s: %s", test_url, e)
+        return test_url, None
+
+    # All probes fire concurrently and the first working indexer endpoint
+    # wins: discovery costs one round-trip instead of up to five sequential
+    # 5s timeouts against a slow or misbehaving host.
+    base_url: str | None = None
+    pool = ThreadPoolExecutor(max_workers=len(api_paths))
+    try:
+      futures = [pool.submit(probe, url) for url in api_paths]
+      for future in as_completed(futures):
+        test_url, response = future.result()
+        if response is None:
+          continue
+        content_type = response.headers.get("content-type", "unknown")
+        logger.debug("  %s: status %s, Content-Type: %s", test_url, response.status_code, content_type)
+        if response.status_code == 200 and "json" in content_type and "indexer" in test_url:
+          base_url = test_url.rsplit("/", 1)[0]  # Remove the last part to get base URL
+          break
+    finally:
+      # Don't wait for the losing probes to time out
+      pool.shutdown(wait=False, cancel_futures=True)
+
+    if base_url:
+      logger.debug("  SUCCESS: Found working API endpoint!")
+      self._store_cached_endpoint(base_url)
+      return base_url
 
     raise ConnectionError(
       "Could not find a working API endpoint. Please check:\n"
@@ -275,51 +470,50 @@ class ProwlarrApiClient:
   def fetch_indexers(self) -> list[dict[str, Any]]:
     """Fetch all indexers from Prowlarr."""
     base_url = self._discover_api_endpoint()
-    print(f"Using base URL: {base_url}")
+    logger.debug("Using base URL: %s", base_url)
 
     indexer_endpoints = ["indexer", "indexers"]
 
     for endpoint in indexer_endpoints:
       try:
         url = f"{base_url}/{endpoint}"
-        print(f"Trying endpoint: {url}")
+        logger.debug("Trying endpoint: %s", url)
 
         response = self.session.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
-        print(f"Response status code: {response.status_code}")
-        print(f"Response headers: {dict(response.headers)}")
-        print(f"Response content: {response.text[:500]}")  # First 500 chars
+        logger.debug("Response status code: %s", response.status_code)
+        # %r defers the headers-dict materialization and the body slice to
+        # the (normally disabled) DEBUG formatting path
+        logger.debug("Response headers: %r", response.headers)
+        logger.debug("Response content: %.500s", response.text)
 
         if response.status_code != 200:
-          print(f"Failed to fetch from {endpoint}. Status: {response.status_code}")
-          print(f"Response: {response.text}")
+          logger.debug("Failed to fetch from %s. Status: %s", endpoint, response.status_code)
+          logger.debug("Response: %s", response.text)
           continue
 
         content_type = response.headers.get("content-type", "")
         if "application/json" not in content_type:
-          print(f"Warning: Response doesn't appear to be JSON. Content-Type: {content_type}")
+          logger.debug("Response doesn't appear to be JSON. Content-Type: %s", content_type)
           continue
 
         indexers = response.json()
-        print(f"Found {len(indexers)} items from {endpoint} endpoint.")
+        logger.debug("Found %d items from %s endpoint.", len(indexers), endpoint)
+        self._indexer_endpoint = url
         return indexers
 
       except requests.exceptions.ConnectionError as e:
-        print(f"Connection error for {endpoint}: Could not connect to Prowlarr at {base_url}")
-        print(f"Error details: {e}")
+        logger.debug("Connection error for %s: could not connect at %s: %s", endpoint, base_url, e)
         continue
       except requests.exceptions.Timeout as e:
-        print(
-          f"Timeout error for {endpoint}: Request timed out after {REQUEST_TIMEOUT_SECONDS} seconds"
+        logger.debug(
+          "Timeout for %s after %s seconds: %s", endpoint, REQUEST_TIMEOUT_SECONDS, e
         )
-        print(f"Error details: {e}")
         continue
       except requests.exceptions.JSONDecodeError as e:
-        print(f"JSON decode error for {endpoint}: Response is not valid JSON")
-        print(f"Error details: {e}")
-        print(f"Raw response: {response.text}")
+        logger.debug("JSON decode error for %s: %s; raw response: %s", endpoint, e, response.text)
         continue
       except Exception as e:
-        print(f"Unexpected error for {endpoint}: {e}")
+        logger.debug("Unexpected error for %s: %s", endpoint, e)
         continue
 
     raise ConnectionError(
@@ -327,78 +521,59 @@ class ProwlarrApiClient:
       "Please check if Prowlarr is running and accessible at the specified address.",
     )
 
-  def update_indexer(self, indexer: dict[str, Any], base_url: str) -> UpdateResult:
-    """Update a single indexer's priority."""
+  def update_indexer(self, indexer: dict[str, Any]) -> UpdateResult:
+    """Update a single indexer's priority via the endpoint fetch_indexers found."""
     indexer_id = indexer["id"]
     indexer_name = indexer["name"]
 
-    update_endpoints = [
-      f"{base_url}/indexer/{indexer_id}",
-      f"{base_url}/indexers/{indexer_id}",
-    ]
+    # The old endpoint-variant loop broke after its first iteration, so the
+    # second variant was dead code; a single cached URL does the same work
+    base = self._indexer_endpoint or f"{self.config.base_url}/v1/indexer"
+    endpoint = f"{base}/{indexer_id}"
 
-    for endpoint in update_endpoints:
-      print(f"Trying to update via: {endpoint}")
-
-      for attempt in range(MAX_RETRY_ATTEMPTS):
-        try:
-          response = self.session.put(endpoint, json=indexer, timeout=REQUEST_TIMEOUT_SECONDS)
-          print(f"Response status: {response.status_code}")
-
-          if response.status_code in [200, 202]:
-            priority = indexer.get("priority", "N/A")
-            print(f"✓ Successfully updated {indexer_name} -> priority {priority}")
-            return UpdateResult(
-              indexer_name=indexer_name,
-              success=True,
-              message=f"Priority updated to {priority}",
-            )
-          elif response.status_code == 500 and "database is locked" in response.text:
-            if attempt < MAX_RETRY_ATTEMPTS - 1:
-              print(
-                f"Database locked, retrying in {RETRY_DELAY_SECONDS} seconds... (attempt {attempt + 1}/{MAX_RETRY_ATTEMPTS})"
-              )
-              time.sleep(RETRY_DELAY_SECONDS)
-              continue
-            else:
-              return UpdateResult(
-                indexer_name=indexer_name,
-                success=False,
-                message="Failed after 3 attempts due to database lock",
-                error_type="database_lock",
-              )
-          else:
-            error_type, error_description = ErrorClassifier.classify_error(
-              response.status_code,
-              response.text,
-              indexer_name,
-            )
-            print(f"✗ Failed with status {response.status_code}: {error_description}")
-
-            return UpdateResult(
-              indexer_name=indexer_name,
-              success=False,
-              message=error_description,
-              error_type=error_type,
-            )
-
-        except Exception as e:
-          print(f"✗ Exception during update: {e}")
-          return UpdateResult(
-            indexer_name=indexer_name,
-            success=False,
-            message=f"Exception: {e}",
-            error_type="exception",
-          )
-
-      break  # Only try the first working endpoint
-
-    return UpdateResult(
-      indexer_name=indexer_name,
-      success=False,
-      message="Failed to update via any endpoint",
-      error_type="connection_error",
-    )
+    try:
+      # Transient 500s are retried with backoff by the session's adapter;
+      # a 500 reaching this point has already exhausted those retries
+      response = self.session.put(endpoint, json=indexer, timeout=REQUEST_TIMEOUT_SECONDS)
+
+      if response.status_code in [200, 202]:
+        priority = indexer.get("priority", "N/A")
+        print(f"✓ Successfully updated {indexer_name} -> priority {priority}")
+        return UpdateResult(
+          indexer_name=indexer_name,
+          success=True,
+          message=f"Priority updated to {priority}",
+        )
+      elif response.status_code == 500 and "database is locked" in response.text:
+        return UpdateResult(
+          indexer_name=indexer_name,
+          success=False,
+          message=f"Failed after {MAX_RETRY_ATTEMPTS} attempts due to database lock",
+          error_type="database_lock",
+        )
+      else:
+        error_type, error_description = ErrorClassifier.classify_error(
+          response.status_code,
+          response.text,
+          indexer_name,
+        )
+        print(f"✗ Failed with status {response.status_code}: {error_description}")
+
+        return UpdateResult(
+          indexer_name=indexer_name,
+          success=False,
+          message=error_description,
+          error_type=error_type,
+        )
+
+    except Exception as e:
+      print(f"✗ Exception during update: {e}")
+      return UpdateResult(
+        indexer_name=indexer_name,
+        success=False,
+        message=f"Exception: {e}",
+        error_type="exception",
+      )
 
 
 class IndexerPriorityUpdater:
@@ -408,7 +583,7 @@ class IndexerPriorityUpdater:
     self.config = config
     self.dry_run = dry_run
     self.api_client = ProwlarrApiClient(config)
-    self.matcher = IndexerMatcher()
+    self.matcher = IndexerMatcher(list(INDEXER_PRIORITIES.keys()))
     self.validator = IndexerValidator()
     self.summary = ProcessingSummary()
 
@@ -436,30 +611,39 @@ class IndexerPriorityUpdater:
     print("UPDATING INDEXER PRIORITIES")
     print("=" * 50)
 
-    available_priority_names = list(INDEXER_PRIORITIES.keys())
-    # Discover the base URL once at the beginning if we're not in dry-run mode
-    base_url = None
-    if not self.dry_run:
-      base_url = self.api_client._discover_api_endpoint()
-
+    to_update: list[tuple[dict[str, Any], int]] = []
     for indexer in indexers:
       indexer_name = indexer["name"]
 
       # Try to find a match in our priorities (with fuzzy matching)
-      match_result = self.matcher.find_best_match(
-        indexer_name,
-        available_priority_names,
-      )
+      match_result = self.matcher.find_best_match(indexer_name)
 
       if match_result.is_match:
-        self._process_matched_indexer(indexer, match_result, base_url)
+        if (pending := self._process_matched_indexer(indexer, match_result)) is not None:
+          to_update.append(pending)
       else:
         print(f"{indexer_name} not in priority list, skipping.")
         self.summary.add_result("skipped", indexer_name)
 
+    if not to_update:
+      return
+
+    # Each PUT targets a distinct indexer id, so the updates are independent
+    # I/O: fan them out over the session's pooled connections and record the
+    # outcomes back on the main thread (the summary is only touched here, so
+    # it needs no locking).
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_UPDATES, len(to_update))) as pool:
+      futures = {
+        pool.submit(self.api_client.update_indexer, {**ix, "priority": p}): (ix, p)
+        for ix, p in to_update
+      }
+      for future in as_completed(futures):
+        indexer, new_priority = futures[future]
+        self._record_update_result(indexer, new_priority, future.result())
+
   def _process_matched_indexer(
-    self, indexer: dict[str, Any], match_result: IndexerMatchResult, base_url: str | None
-  ) -> None:
+    self, indexer: dict[str, Any], match_result: IndexerMatchResult
+  ) -> tuple[dict[str, Any], int] | None:
     """Process an indexer that matches our priority list."""
     indexer_name = indexer["name"]
     matched_name = match_result.matched_name
@@ -482,7 +666,7 @@ class IndexerPriorityUpdater:
     if not can_update:
       print(f"⏭️  Skipping {indexer_name}: {update_reason}")
       self.summary.add_result("skipped_invalid", f"{indexer_name}: {update_reason}")
-      return
+      return None
 
     should_skip, skip_reason = self.validator.should_skip_update(indexer, new_priority)
     if should_skip:
@@ -490,43 +674,36 @@ class IndexerPriorityUpdater:
       self.summary.add_result("skipped_unchanged", f"{indexer_name}: {skip_reason}")
       self.summary.increment_successful()  # Count as success since it's already correct
       self.summary.increment_attempted()
-      return
-
-    # Update the indexer
-    self._update_indexer_priority(indexer, new_priority, base_url)
-
-  def _update_indexer_priority(
-    self, indexer: dict[str, Any], new_priority: int, base_url: str | None
-  ) -> None:
-    """Update an indexer's priority."""
-    indexer_name = indexer["name"]
-    current_priority = indexer.get("priority", "N/A")
-
-    # For Prowlarr, we need to send the full indexer object back with updated priority
-    # Make a deep copy to avoid any reference issues
-    import copy
-
-    updated_indexer = copy.deepcopy(indexer)
-    updated_indexer["priority"] = new_priority
+      return None
 
     self.summary.increment_attempted()
 
     if self.dry_run:
+      current_priority = indexer.get("priority", "N/A")
       print(f"🔍 DRY RUN: Would update {indexer_name} -> priority {new_priority}")
       self.summary.increment_successful()
       self.summary.add_result("success", f"{indexer_name}: {current_priority} → {new_priority}")
-      return
+      return None
 
-    # Perform the actual update
-    result = self.api_client.update_indexer(updated_indexer, base_url)
+    # Queue for the parallel update pass in _process_indexers. Prowlarr wants
+    # the full indexer object back; only the top-level "priority" changes, so
+    # the submit site shallow-merges {**indexer, "priority": new} — nested
+    # fields/capabilities are shared by reference but only serialized to JSON
+    # for the PUT, never mutated.
+    return indexer, new_priority
+
+  def _record_update_result(
+    self, indexer: dict[str, Any], new_priority: int, result: UpdateResult
+  ) -> None:
+    """Fold one completed update into the summary."""
+    indexer_name = indexer["name"]
+    current_priority = indexer.get("priority", "N/A")
 
     if result.success:
       self.summary.increment_successful()
       self.summary.add_result("success", f"{indexer_name}: {current_priority} → {new_priority}")
     else:
       self._handle_update_failure(result)
-
-    if not result.success:
       print(f"Failed to update {indexer_name} via any endpoint")
 
   def _handle_update_failure(self, result: UpdateResult) -> None:
@@ -555,65 +732,65 @@ class IndexerPriorityUpdater:
     print(f"Total indexers found: {total_indexers}")
     print(f"Total indexers in priority list: {self.summary.total_attempted}")
     print(f"Successfully updated: {self.summary.successful_updates}")
-    print(f"Skipped (not in priority list): {len(self.summary.results['skipped'])}")
+    print(f"Skipped (not in priority list): {len(self.summary.skipped)}")
 
-    if self.summary.results["success"]:
-      print(f"\n✅ Successfully updated ({len(self.summary.results['success'])}):")
-      for update in self.summary.results["success"]:
+    if self.summary.success:
+      print(f"\n✅ Successfully updated ({len(self.summary.success)}):")
+      for update in self.summary.success:
         print(f"  - {update}")
 
-    if self.summary.results["skipped_unchanged"]:
+    if self.summary.skipped_unchanged:
       print(
-        f"\n⏭️  Skipped - already correct priority ({len(self.summary.results['skipped_unchanged'])}):"
+        f"\n⏭️  Skipped - already correct priority ({len(self.summary.skipped_unchanged)}):"
       )
-      for item in self.summary.results["skipped_unchanged"]:
+      for item in self.summary.skipped_unchanged:
         print(f"  - {item}")
 
-    if self.summary.results["skipped_invalid"]:
+    if self.summary.skipped_invalid:
       print(
-        f"\n⏭️  Skipped - indexer not updateable ({len(self.summary.results['skipped_invalid'])}):"
+        f"\n⏭️  Skipped - indexer not updateable ({len(self.summary.skipped_invalid)}):"
       )
-      for item in self.summary.results["skipped_invalid"]:
+      for item in self.summary.skipped_invalid:
         print(f"  - {item}")
 
-    if self.summary.results["database_locked"]:
-      print(f"\n🔄 Temporary database locks ({len(self.summary.results['database_locked'])}):")
-      for name in self.summary.results["database_locked"]:
+    if self.summary.database_locked:
+      print(f"\n🔄 Temporary database locks ({len(self.summary.database_locked)}):")
+      for name in self.summary.database_locked:
         print(f"  - {name}")
       print("  💡 These are temporary issues - try running the script again.")
 
-    if self.summary.results["indexer_issues"]:
-      print(f"\n🔧 Indexer configuration issues ({len(self.summary.results['indexer_issues'])}):")
-      for item in self.summary.results["indexer_issues"]:
+    if self.summary.indexer_issues:
+      print(f"\n🔧 Indexer configuration issues ({len(self.summary.indexer_issues)}):")
+      for item in self.summary.indexer_issues:
         print(f"  - {item}")
       print(
         "  💡 These are indexer-specific problems, not script failures. Check indexer settings in Prowlarr UI."
       )
 
-    if self.summary.results["script_errors"]:
-      print(f"\n❌ Script configuration errors ({len(self.summary.results['script_errors'])}):")
-      for item in self.summary.results["script_errors"]:
+    if self.summary.script_errors:
+      print(f"\n❌ Script configuration errors ({len(self.summary.script_errors)}):")
+      for item in self.summary.script_errors:
         print(f"  - {item}")
       print("  💡 These need to be fixed in the script configuration.")
 
-    if self.summary.results["other_error"]:
-      print(f"\n❓ Other errors ({len(self.summary.results['other_error'])}):")
-      for item in self.summary.results["other_error"]:
+    if self.summary.other_error:
+      print(f"\n❓ Other errors ({len(self.summary.other_error)}):")
+      for item in self.summary.other_error:
         print(f"  - {item}")
 
-    if self.summary.results["exception"]:
-      print(f"\n💥 Exceptions ({len(self.summary.results['exception'])}):")
-      for name in self.summary.results["exception"]:
+    if self.summary.exception:
+      print(f"\n💥 Exceptions ({len(self.summary.exception)}):")
+      for name in self.summary.exception:
         print(f"  - {name}")
 
     # Calculate real failures (excluding indexer issues which aren't script failures)
     real_failures = (
-      len(self.summary.results["database_locked"])
-      + len(self.summary.results["script_errors"])
-      + len(self.summary.results["other_error"])
-      + len(self.summary.results["exception"])
+      len(self.summary.database_locked)
+      + len(self.summary.script_errors)
+      + len(self.summary.other_error)
+      + len(self.summary.exception)
     )
-    indexer_issues = len(self.summary.results["indexer_issues"])
+    indexer_issues = len(self.summary.indexer_issues)
 
     print(
       f"\n🎯 Success rate: {self.summary.successful_updates}/{self.summary.total_attempted} "
@@ -649,16 +826,18 @@ class IndexerPriorityUpdater:
 
 def create_configuration() -> ProwlarrConfiguration:
   """Create configuration from environment variables."""
-  api_key = os.getenv("API_KEY_PROWLARR")
+  env = os.environ  # bind once; os.getenv is just a wrapper around this .get
+  api_key = env.get("API_KEY_PROWLARR")
   if not api_key:
     print("❌ Error: API_KEY_PROWLARR not found in .env file")
     print("Please ensure your .env file contains: API_KEY_PROWLARR=your_api_key_here")
     sys.exit(1)
 
-  host = os.getenv("PROWLARR_HOST", DEFAULT_HOST)
-  port = int(os.getenv("PROWLARR_PORT", str(DEFAULT_PORT)))
-
-  return ProwlarrConfiguration(api_key=api_key, host=host, port=port)
+  return ProwlarrConfiguration(
+    api_key=api_key,
+    host=env.get("PROWLARR_HOST", DEFAULT_HOST),
+    port=int(env.get("PROWLARR_PORT", str(DEFAULT_PORT))),
+  )
 
 
 def main() -> None:
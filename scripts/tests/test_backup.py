@@ -5,6 +5,8 @@ from pathlib import Path
 
 
 def _load_backup_module():
+  if "config_backup" in sys.modules:
+    return sys.modules["config_backup"]
   root = Path(__file__).resolve().parents[2]
   scripts_dir = root / "scripts"
   if str(scripts_dir) not in sys.path:
@@ -13,6 +15,7 @@ def _load_backup_module():
   spec = importlib.util.spec_from_file_location("config_backup", script_path)
   module = importlib.util.module_from_spec(spec)
   assert spec.loader is not None
+  sys.modules[spec.name] = module  # type: ignore[attr-defined]
   spec.loader.exec_module(module)  # type: ignore[attr-defined]
   return module
 
@@ -63,6 +66,70 @@ def test_create_backup_success(tmp_path: Path):
     assert "sonarr/nested/file2.log" in names
 
 
+def test_create_backup_parallel_parts(tmp_path: Path):
+  config_root = tmp_path / "config"
+  create_file(config_root / "prowlarr" / "file1.txt")
+  create_file(config_root / "sonarr" / "nested" / "file2.log")
+  backup_dir = tmp_path / "backups"
+  backup_dir.mkdir()
+
+  code, msg = cb.create_backup_parallel(
+    config_root,
+    backup_dir,
+    services=["prowlarr", "sonarr"],
+    exclude_patterns=[],
+    max_file_size_mb=None,
+    do_checksum=True,
+  )
+
+  assert code == 0, msg
+  parts = sorted(p.name for p in backup_dir.glob("configs-*-*.tar.gz"))
+  assert len(parts) == 2
+  manifests = list(backup_dir.glob("configs-*.sha256"))
+  assert len(manifests) == 1
+  # One checksum line per part, referencing the part filenames
+  lines = manifests[0].read_text().strip().splitlines()
+  assert len(lines) == 2
+  for line in lines:
+    digest, name = line.split()
+    assert len(digest) == 64
+    assert name in parts
+  with tarfile.open(backup_dir / [p for p in parts if "prowlarr" in p][0], "r:gz") as tar:
+    assert "prowlarr/file1.txt" in tar.getnames()
+
+
+def test_prune_archives_keeps_whole_runs(tmp_path: Path):
+  backup_dir = tmp_path / "backups"
+  backup_dir.mkdir()
+  # Two old single-mode runs, then one parallel run (two parts + manifest)
+  create_file(backup_dir / "configs-20260101-010101.tar.gz")
+  create_file(backup_dir / "configs-20260102-010101.tar.gz")
+  for part in ("prowlarr", "sonarr"):
+    create_file(backup_dir / f"configs-20260103-010101-{part}.tar.gz")
+  create_file(backup_dir / "configs-20260103-010101.sha256")
+
+  deleted = cb.prune_archives(backup_dir, retain=2)
+
+  # Only the oldest run goes; the parallel run survives intact with its manifest
+  assert sorted(e.name for e in deleted) == ["configs-20260101-010101.tar.gz"]
+  remaining = sorted(p.name for p in backup_dir.iterdir())
+  assert remaining == [
+    "configs-20260102-010101.tar.gz",
+    "configs-20260103-010101-prowlarr.tar.gz",
+    "configs-20260103-010101-sonarr.tar.gz",
+    "configs-20260103-010101.sha256",
+  ]
+
+  # Pruning to one run removes the single-mode archive and nothing else
+  deleted = cb.prune_archives(backup_dir, retain=1)
+  assert sorted(e.name for e in deleted) == ["configs-20260102-010101.tar.gz"]
+  assert sorted(p.name for p in backup_dir.iterdir()) == [
+    "configs-20260103-010101-prowlarr.tar.gz",
+    "configs-20260103-010101-sonarr.tar.gz",
+    "configs-20260103-010101.sha256",
+  ]
+
+
 def test_create_backup_with_missing_service(tmp_path: Path):
   config_root = tmp_path / "config"
   svc_a = config_root / "prowlarr"
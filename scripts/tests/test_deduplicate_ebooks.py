@@ -0,0 +1,42 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_dedup_module():
+  root = Path(__file__).resolve().parents[2]
+  scripts_dir = root / "scripts"
+  if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+  script_path = scripts_dir / "deduplicate_ebooks.py"
+  spec = importlib.util.spec_from_file_location("deduplicate_ebooks", script_path)
+  module = importlib.util.module_from_spec(spec)
+  assert spec.loader is not None
+  spec.loader.exec_module(module)  # type: ignore[attr-defined]
+  return module
+
+
+dedup = _load_dedup_module()
+
+
+def test_normalize_title_punctuation_and_articles():
+  assert dedup.normalize_title("The Hitch-Hiker's Guide: Part One") == "hitch hiker s guide part one"
+  assert dedup.normalize_title("A  Tale of   Two Cities") == "tale of two cities"
+  assert dedup.normalize_title("An [Annotated] Edition") == "annotated edition"
+  # Lone article is a title, not a prefix to strip
+  assert dedup.normalize_title("The") == "the"
+  assert dedup.normalize_title("") == ""
+
+
+def test_normalize_author():
+  assert dedup.normalize_author("Tolkien, J.R.R.") == "tolkien j r r"
+  assert dedup.normalize_author("  Ursula   K. Le Guin ") == "ursula k le guin"
+  assert dedup.normalize_author("") == ""
+
+
+def test_is_garbage_file():
+  assert dedup.is_garbage_file("/books/author/cover.jpg")
+  assert dedup.is_garbage_file("/books/author/metadata.opf")
+  assert dedup.is_garbage_file("/books/.hidden/book.epub")
+  assert not dedup.is_garbage_file("/books/author/book.epub")
+  assert not dedup.is_garbage_file("/books/author/book.pdf")
@@ -4,6 +4,8 @@ from pathlib import Path
 
 
 def _load_checker_module():
+  if "prowlarr_priority_checker" in sys.modules:
+    return sys.modules["prowlarr_priority_checker"]
   root = Path(__file__).resolve().parents[2]
   scripts_dir = root / "scripts"
   if str(scripts_dir) not in sys.path:
@@ -12,6 +14,7 @@ def _load_checker_module():
   spec = importlib.util.spec_from_file_location("prowlarr_priority_checker", script_path)
   module = importlib.util.module_from_spec(spec)
   assert spec.loader is not None
+  sys.modules[spec.name] = module  # type: ignore[attr-defined]
   spec.loader.exec_module(module)  # type: ignore[attr-defined]
   return module
 
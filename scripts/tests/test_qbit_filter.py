@@ -4,6 +4,8 @@ from pathlib import Path
 
 
 def _load_qb_module():
+  if "qbittorrent_stalled_kickstart" in sys.modules:
+    return sys.modules["qbittorrent_stalled_kickstart"]
   root = Path(__file__).resolve().parents[2]
   scripts_dir = root / "scripts"
   if str(scripts_dir) not in sys.path:
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Unified Radarr naming validator.
+
+Runs the autoconfig-drift check and the naming/folder check from one
+process, so back-to-back cron or CI invocations share a single Python
+startup, one keep-alive HTTP session (via _arr_http), and the cached
+naming.json parse instead of paying each once per script.
+
+Usage:
+  python3 scripts/validate_radarr.py                     # run both checks
+  python3 scripts/validate_radarr.py autoconfig
+  python3 scripts/validate_radarr.py naming-and-folders
+
+Exit Codes:
+  0 - all requested checks passed
+  1 - at least one check failed
+"""
+
+import argparse
+import sys
+
+import validate_radarr_autoconfig_naming
+import validate_radarr_naming
+
+
+def main() -> int:
+  parser = argparse.ArgumentParser(description="Validate Radarr naming configuration")
+  all_checks = ["autoconfig", "naming-and-folders"]
+  # choices= is validated manually: older 3.11 argparse rejects its own
+  # empty default for positional nargs="*" arguments with choices set
+  parser.add_argument(
+    "checks",
+    nargs="*",
+    metavar="{autoconfig,naming-and-folders}",
+    help="Checks to run (default: both)",
+  )
+  args = parser.parse_args()
+  if invalid := [c for c in args.checks if c not in all_checks]:
+    parser.error(f"invalid choice: {', '.join(invalid)} (choose from {', '.join(all_checks)})")
+  checks = args.checks or all_checks
+
+  exit_code = 0
+  if "autoconfig" in checks:
+    exit_code = max(exit_code, validate_radarr_autoconfig_naming.main())
+  if "naming-and-folders" in checks:
+    if "autoconfig" in checks:
+      print()
+    exit_code = max(exit_code, validate_radarr_naming.main())
+  return exit_code
+
+
+if __name__ == "__main__":
+  sys.exit(main())
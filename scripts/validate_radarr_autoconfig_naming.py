@@ -3,19 +3,33 @@
 Validate that Radarr's naming configuration matches the locked custom naming.json.
 This ensures AutoConfig script hasn't overwritten with external sources.
 """
-import json
+import functools
 import sys
 import os
-import subprocess
+
+from _arr_http import get_json_conditional
+
+# orjson's SIMD parser is several times faster than stdlib json and takes
+# bytes directly; stdlib json accepts bytes too, so the fallback needs no
+# decode step either.
+try:  # pragma: no cover - optional speedup
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 RADARR_API_KEY = os.getenv("API_KEY_RADARR")
 RADARR_URL = "http://localhost:7878"
 NAMING_JSON_PATH = os.getenv("CONFIG_DIRECTORY", "/mnt/docker-usb") + "/radarr/extended/naming.json"
 
+@functools.lru_cache(maxsize=1)
 def get_expected_naming() -> dict:
-    """Load expected naming from custom naming.json."""
-    with open(NAMING_JSON_PATH, 'r') as f:
-        naming_data = json.load(f)
+    """Load expected naming from custom naming.json.
+
+    naming.json is a locked file at a fixed path, so parse it once per
+    process; batch runners that validate repeatedly skip the re-read.
+    """
+    with open(NAMING_JSON_PATH, 'rb') as f:
+        naming_data = _json.loads(f.read())
     return {
         'movieFolderFormat': naming_data['folder']['default'],
         'standardMovieFormat': naming_data['file']['default']
@@ -23,13 +37,7 @@ def get_expected_naming() -> dict:
 
 def get_current_naming() -> dict:
     """Fetch current naming from Radarr API."""
-    cmd = [
-        "curl", "-s",
-        "-H", f"X-Api-Key: {RADARR_API_KEY}",
-        f"{RADARR_URL}/api/v3/config/naming"
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    data = json.loads(result.stdout)
+    data = get_json_conditional(f"{RADARR_URL}/api/v3/config/naming", RADARR_API_KEY)
     return {
         'movieFolderFormat': data['movieFolderFormat'],
         'standardMovieFormat': data['standardMovieFormat']
@@ -5,68 +5,82 @@ Run this after any Radarr config changes to ensure folders stay properly formatt
 """
 import os
 import sys
-import json
-import subprocess
-import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from _arr_http import get_json_conditional
 
 RADARR_API_KEY = os.getenv("API_KEY_RADARR")
 RADARR_URL = "http://localhost:7878"
 MOVIES_DIR = os.getenv("SHARE_DIRECTORY", "/mnt/drive-next") + "/Movies"
+# bytes form for the directory syscalls below: listdir/scandir on a bytes
+# path return bytes names, skipping the per-entry filesystem-encoding decode
+# that str mode performs on every name.
+MOVIES_DIR_B = os.fsencode(MOVIES_DIR)
 
 EXPECTED_FOLDER_FORMAT = "{Movie Collection}{Movie Collection: - }{Movie CleanTitleThe} ({Release Year})"
 
 def get_naming_config() -> dict:
     """Fetch current naming configuration from Radarr API."""
-    cmd = [
-        "curl", "-s",
-        "-H", f"X-Api-Key: {RADARR_API_KEY}",
-        f"{RADARR_URL}/api/v3/config/naming"
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return json.loads(result.stdout)
+    return get_json_conditional(f"{RADARR_URL}/api/v3/config/naming", RADARR_API_KEY)
 
 def validate_naming_config() -> bool:
     """Check if naming configuration matches expected format."""
     config = get_naming_config()
     folder_format = config.get("movieFolderFormat", "")
     rename_enabled = config.get("renameMovies", False)
-    
-    issues = []
-    
+
+    # Happy path — ~100% of steady-state runs — returns before any
+    # diagnostic f-string is ever formatted
+    if folder_format == EXPECTED_FOLDER_FORMAT and rename_enabled:
+        print("✓ Naming configuration is correct")
+        return True
+
+    print("NAMING CONFIG ISSUES FOUND:", file=sys.stderr)
     if folder_format != EXPECTED_FOLDER_FORMAT:
-        issues.append(f"Folder format mismatch:\n  Expected: {EXPECTED_FOLDER_FORMAT}\n  Current:  {folder_format}")
-    
+        print(f"  - Folder format mismatch:\n  Expected: {EXPECTED_FOLDER_FORMAT}\n  Current:  {folder_format}", file=sys.stderr)
     if not rename_enabled:
-        issues.append("Movie renaming is DISABLED - should be enabled")
-    
-    if issues:
-        print("NAMING CONFIG ISSUES FOUND:", file=sys.stderr)
-        for issue in issues:
-            print(f"  - {issue}", file=sys.stderr)
-        return False
-    
-    print("✓ Naming configuration is correct")
-    return True
+        print("  - Movie renaming is DISABLED - should be enabled", file=sys.stderr)
+    return False
 
 def check_folder_names() -> int:
     """Scan movie folders for literal pattern text."""
-    if not os.path.exists(MOVIES_DIR):
+    # Fast reject for the steady state: one C-level substring scan over all
+    # names joined into a single buffer, instead of a Python-level `in` check
+    # per entry. Clean libraries (~100% of runs) return after this one pass;
+    # only when a brace shows up somewhere does the per-entry loop run.
+    try:
+        joined_names = b"\n".join(os.listdir(MOVIES_DIR_B))
+    except FileNotFoundError:
         print(f"ERROR: Movies directory not found: {MOVIES_DIR}", file=sys.stderr)
         return 1
-    
-    movies_path = Path(MOVIES_DIR)
-    broken_folders = [f for f in movies_path.iterdir() if f.is_dir() and '{' in f.name]
-    
-    if broken_folders:
-        print(f"ERROR: Found {len(broken_folders)} folders with literal pattern text:", file=sys.stderr)
-        for folder in broken_folders[:5]:
-            print(f"  - {folder.name}", file=sys.stderr)
-        if len(broken_folders) > 5:
-            print(f"  ... and {len(broken_folders) - 5} more", file=sys.stderr)
+    if b'{' not in joined_names:
+        print("✓ All movie folder names are clean")
+        return 0
+
+    # Output only ever shows five names, so keep at most five and just count
+    # the rest.
+    broken_names = []
+    broken_count = 0
+    try:
+        with os.scandir(MOVIES_DIR_B) as entries:
+            for entry in entries:
+                if b'{' in entry.name and entry.is_dir(follow_symlinks=False):
+                    broken_count += 1
+                    if len(broken_names) < 5:
+                        broken_names.append(os.fsdecode(entry.name))
+    except FileNotFoundError:
+        print(f"ERROR: Movies directory not found: {MOVIES_DIR}", file=sys.stderr)
+        return 1
+
+    if broken_count:
+        print(f"ERROR: Found {broken_count} folders with literal pattern text:", file=sys.stderr)
+        for name in broken_names:
+            print(f"  - {name}", file=sys.stderr)
+        if broken_count > 5:
+            print(f"  ... and {broken_count - 5} more", file=sys.stderr)
         print("\nRun: python3 scripts/fix_radarr_folders.py", file=sys.stderr)
         return 1
-    
+
     print("✓ All movie folder names are clean")
     return 0
 
@@ -76,11 +90,14 @@ def main() -> int:
         print("ERROR: API_KEY_RADARR environment variable not set", file=sys.stderr)
         return 1
     
-    print("Checking Radarr naming configuration...")
-    config_ok = validate_naming_config()
-    
-    print("\nChecking movie folder names...")
-    folders_ok = check_folder_names() == 0
+    # The API fetch and the folder scan touch different resources (network
+    # vs disk), so overlap them instead of paying both latencies in sequence.
+    print("Checking Radarr naming configuration and movie folder names...")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        config_future = pool.submit(validate_naming_config)
+        folders_future = pool.submit(check_folder_names)
+        config_ok = config_future.result()
+        folders_ok = folders_future.result() == 0
     
     if config_ok and folders_ok:
         print("\n✓ All checks passed - Radarr naming is properly configured")